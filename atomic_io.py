@@ -0,0 +1,63 @@
+# atomic_io.py
+"""
+Crash-safe file writes for everything the scrapers save or publish
+- Data goes to a temporary file in the destination directory, is flushed and fsynced,
+  then renamed over the final name with os.replace
+- Readers (the dev server, a CDN sync) see either the old file or the complete new
+  one, never a partial write; a crash leaves the previous version in place
+- The directory is fsynced after the rename so the new name survives a power loss
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+def fsync_directory(directory):
+    """Persist a rename; a no-op where directories can't be opened (Windows)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_write(path, mode='w', encoding='utf-8'):
+    """Open a temporary sibling of `path` for writing; it replaces `path` only on success"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, encoding=None if 'b' in mode else encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600 files; published files must stay world-readable
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    fsync_directory(directory)
+
+
+def write_bytes(path, content):
+    with atomic_write(path, 'wb') as f:
+        f.write(content)
+
+
+def write_text(path, text):
+    with atomic_write(path) as f:
+        f.write(text)
+
+
+def write_json(path, data, **dump_kwargs):
+    with atomic_write(path) as f:
+        json.dump(data, f, **dump_kwargs)
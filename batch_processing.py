@@ -0,0 +1,133 @@
+# batch_processing.py
+"""
+Vectorized batch processing of NASA Exoplanet Archive rows
+- Converts a batch of TAP rows into columnar NumPy arrays
+- Classifies type, habitability and discovery method with array comparisons
+- Produces exactly the same planets as the scrapers' per-row process_planet_data,
+  including which rows get dropped for missing (null) values
+- Falls back to the per-row path when NumPy is not installed
+"""
+
+from itertools import islice
+
+from tap_query import DISCOVERY_COLUMNS, FIELD_COLUMNS, HOST_COLUMN, NAME_COLUMN, field_values
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMERIC_TYPES = {int, float, bool}
+
+RADIUS_BINS = [0.8, 1.25, 2.0, 6.0]
+RADIUS_TYPES = ['Sub-Earth', 'Terrestrial', 'Super Earth', 'Mini Neptune', 'Gas Giant']
+MASS_JUPITER_BINS = [0.1, 0.5]
+MASS_JUPITER_TYPES = ['Super Earth', 'Neptune-like', 'Jupiter-like']
+
+# Discovery method label for each bit pattern of DISCOVERY_COLUMNS (bit i = column i detected)
+DISCOVERY_LABELS = []
+for _bits in range(1 << len(DISCOVERY_COLUMNS)):
+    _methods = [method for bit, (_, method) in enumerate(DISCOVERY_COLUMNS) if _bits & (1 << bit)]
+    DISCOVERY_LABELS.append(', '.join(_methods) if _methods else 'Unknown')
+
+
+def numeric_column(rows, column, nullable=False):
+    """Return (values, valid) arrays for one column.
+
+    Missing keys read as 0 like `row.get(column, 0)`; non-numbers are marked
+    invalid, mirroring where the per-row code raises TypeError. Nulls are
+    invalid too unless `nullable`, in which case they read as 0.
+    """
+    raw = [row.get(column, 0) for row in rows]
+    numeric = np.array([value.__class__ in NUMERIC_TYPES for value in raw], dtype=bool)
+    values = np.array(raw, dtype=object)
+    values[~numeric] = 0.0
+    valid = numeric | np.array([value is None for value in raw], dtype=bool) if nullable else numeric
+    return values.astype(float), valid
+
+
+def classify_planet_types(radius, radius_ok, mass_jupiter, mass_jupiter_ok):
+    radius_type = np.array(RADIUS_TYPES, dtype=object)[np.digitize(radius, RADIUS_BINS)]
+    mass_type = np.array(MASS_JUPITER_TYPES, dtype=object)[np.digitize(mass_jupiter, MASS_JUPITER_BINS)]
+    return np.select(
+        [~radius_ok, radius > 0, ~mass_jupiter_ok, mass_jupiter > 0],
+        ['Unknown', radius_type, 'Unknown', mass_type],
+        default='Unknown'
+    )
+
+
+def determine_habitability(insolation, insolation_ok, radius, radius_ok):
+    in_zone = insolation_ok & (insolation > 0) & (insolation >= 0.3) & (insolation <= 1.7)
+    earth_sized = (radius > 0) & (radius >= 0.5) & (radius <= 2.0)
+    return np.select(
+        [~insolation_ok, in_zone & ~radius_ok, in_zone & earth_sized],
+        ['Unknown', 'Unknown', 'Yes'],
+        default='No'
+    )
+
+
+def determine_discovery_methods(columns):
+    """Labels from one value array per DISCOVERY_COLUMNS entry"""
+    bits = np.zeros(len(columns[0]), dtype=int)
+    for bit, values in enumerate(columns):
+        bits |= (values > 0).astype(int) << bit
+    return np.array(DISCOVERY_LABELS, dtype=object)[bits]
+
+
+def process_batch(rows, scraper):
+    """Process a list of raw rows; same result as the scraper's per-row path"""
+    if np is None:
+        return [planet for planet in map(scraper.process_planet_data, rows) if planet]
+    if not rows:
+        return []
+
+    names = [row.get(NAME_COLUMN, '') for row in rows]
+    radius, radius_ok = numeric_column(rows, FIELD_COLUMNS['radius_earth'])
+    mass, mass_ok = numeric_column(rows, FIELD_COLUMNS['mass_earth'])
+    mass_jupiter, mass_jupiter_ok = numeric_column(rows, FIELD_COLUMNS['mass_jupiter'])
+    insolation, insolation_ok = numeric_column(rows, FIELD_COLUMNS['insolation_earth'])
+    # A null discovery column means "not detected"; only non-numeric values are errors
+    detections = [numeric_column(rows, column, nullable=True) for column, _ in DISCOVERY_COLUMNS]
+
+    # Rows the per-row path drops: no usable name, a null radius or mass, or a
+    # non-numeric value that the discovery-method code compares against zero
+    named = np.fromiter((bool(n) and n != 'Unknown' for n in names), dtype=bool, count=len(rows))
+    keep = named & radius_ok & mass_ok
+    for _, detection_ok in detections:
+        keep &= detection_ok
+
+    planet_types = classify_planet_types(radius, radius_ok, mass_jupiter, mass_jupiter_ok).tolist()
+    habitable = determine_habitability(insolation, insolation_ok, radius, radius_ok).tolist()
+    discovery = determine_discovery_methods([values for values, _ in detections]).tolist()
+
+    planets = []
+    for i in np.flatnonzero(keep).tolist():
+        planets.append({
+            'name': names[i],
+            'host_star': rows[i].get(HOST_COLUMN, 'Unknown'),
+            'type': planet_types[i],
+            'habitable': habitable[i],
+            **field_values(rows[i]),
+            'discovery_method': discovery[i]
+        })
+
+    dropped = len(rows) - len(planets)
+    if dropped:
+        print(f"  ⚠️ Skipped {dropped} rows with missing names or null values")
+    return planets
+
+
+def iter_batches(rows, size=5000):
+    """Group an iterable of rows into lists of at most `size` rows"""
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_processed_batches(rows, scraper, size=5000):
+    """Stream-friendly batch path: process `size` rows at a time, yield planets"""
+    for batch in iter_batches(rows, size):
+        yield from process_batch(batch, scraper)
@@ -0,0 +1,198 @@
+# columnar_export.py
+"""
+Columnar exports of the exoplanet dataset
+- Schema mirrors the keys produced by process_planet_data
+- Parquet (when pyarrow is installed) for downstream analytics
+- A compact little-endian binary layout for local tools, which can map it column by
+  column without parsing; read_columnar() is the reference decoder. It is not published
+  to public/, since the app reads the paged JSON export
+
+Binary layout (all sections 8-byte aligned):
+    b'EXOC' | uint32 header length | JSON header | padding | column buffers
+The header lists every column with its kind, byte offset and byte length:
+    float64      - Float64Array, NaN for missing values
+    category     - Uint8Array/Uint16Array/Uint32Array codes into the header's `dictionary`
+    string       - Uint32Array of rows+1 offsets followed by UTF-8 bytes
+"""
+
+import json
+import struct
+import sys
+from array import array
+
+from atomic_io import atomic_write
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+MAGIC = b'EXOC'
+FORMAT_VERSION = 1
+CATEGORY_TYPECODES = {'uint8': 'B', 'uint16': 'H', 'uint32': 'I'}
+
+# (key, kind) in process_planet_data order
+SCHEMA = [
+    ('name', 'string'),
+    ('host_star', 'category'),
+    ('type', 'category'),
+    ('habitable', 'category'),
+    ('radius_earth', 'float64'),
+    ('mass_earth', 'float64'),
+    ('mass_jupiter', 'float64'),
+    ('radius_jupiter', 'float64'),
+    ('orbital_period_days', 'float64'),
+    ('semi_major_axis_au', 'float64'),
+    ('eccentricity', 'float64'),
+    ('inclination_deg', 'float64'),
+    ('equilibrium_temp_k', 'float64'),
+    ('insolation_earth', 'float64'),
+    ('density_g_cm3', 'float64'),
+    ('surface_gravity_ms2', 'float64'),
+    ('transit_depth_ppm', 'float64'),
+    ('transit_duration_hours', 'float64'),
+    ('discovery_method', 'category'),
+    ('description', 'string'),
+]
+
+
+def to_float(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float('nan')
+
+
+def from_little_endian(typecode, data):
+    buffer = array(typecode)
+    buffer.frombytes(data)
+    if sys.byteorder != 'little':
+        buffer.byteswap()
+    return buffer
+
+
+def little_endian(buffer):
+    if sys.byteorder != 'little':
+        buffer.byteswap()
+    return buffer.tobytes()
+
+
+def encode_column(planets, key, kind):
+    """Return (bytes, extra header fields) for one column"""
+    values = [planet.get(key) for planet in planets]
+    if kind == 'float64':
+        return little_endian(array('d', map(to_float, values))), {}
+    if kind == 'category':
+        dictionary = sorted({'' if v is None else str(v) for v in values})
+        codes = {value: i for i, value in enumerate(dictionary)}
+        if len(dictionary) <= 0xFF:
+            typecode, dtype = 'B', 'uint8'
+        elif len(dictionary) <= 0xFFFF:
+            typecode, dtype = 'H', 'uint16'
+        else:
+            typecode, dtype = 'I', 'uint32'
+        buffer = array(typecode, (codes['' if v is None else str(v)] for v in values))
+        return little_endian(buffer), {'dtype': dtype, 'dictionary': dictionary}
+    # string: offsets then UTF-8 blob
+    encoded = [('' if v is None else str(v)).encode('utf-8') for v in values]
+    offsets = array('I', [0])
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+    return little_endian(offsets) + b''.join(encoded), {'offsets': 4 * len(offsets)}
+
+
+def pad8(length):
+    return (-length) % 8
+
+
+def write_columnar(planets, filename='all_exoplanets.columns.bin'):
+    """Write planets in the browser-friendly columnar binary layout"""
+    buffers = []
+    columns = []
+    offset = 0
+    for key, kind in SCHEMA:
+        data, extra = encode_column(planets, key, kind)
+        columns.append({'name': key, 'kind': kind, 'offset': offset, 'length': len(data), **extra})
+        buffers.append(data + b'\0' * pad8(len(data)))
+        offset += len(data) + pad8(len(data))
+
+    header = json.dumps({'version': FORMAT_VERSION, 'rows': len(planets), 'columns': columns},
+                        separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    # Column offsets are relative to the end of the (padded) header
+    header += b' ' * pad8(8 + len(header))
+
+    with atomic_write(filename, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header)))
+        f.write(header)
+        for data in buffers:
+            f.write(data)
+
+    print(f"🧱 Wrote columnar binary {filename} ({8 + len(header) + offset} bytes)")
+    return filename
+
+
+def write_parquet(planets, filename='all_exoplanets.parquet'):
+    """Write planets as Parquet; returns None when pyarrow is not installed"""
+    if pa is None:
+        print("⚠️ pyarrow not installed, skipping Parquet export")
+        return None
+
+    fields = []
+    arrays = []
+    for key, kind in SCHEMA:
+        values = [planet.get(key) for planet in planets]
+        if kind == 'float64':
+            arrays.append(pa.array([v if isinstance(v, (int, float)) else None for v in values], pa.float64()))
+            fields.append(pa.field(key, pa.float64()))
+        elif kind == 'category':
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+            fields.append(pa.field(key, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            arrays.append(pa.array(values, pa.string()))
+            fields.append(pa.field(key, pa.string()))
+
+    with atomic_write(filename, 'wb') as f:
+        pq.write_table(pa.Table.from_arrays(arrays, schema=pa.schema(fields)), f, compression='zstd')
+    print(f"🧱 Wrote Parquet {filename}")
+    return filename
+
+
+def export_columnar(json_file='all_exoplanets.json', binary_file='all_exoplanets.columns.bin',
+                    parquet_file='all_exoplanets.parquet'):
+    """Write both columnar artifacts next to a saved dataset; returns the files written"""
+    with open(json_file, encoding='utf-8') as f:
+        planets = json.load(f).get('exoplanets', [])
+    written = [write_columnar(planets, binary_file)]
+    if write_parquet(planets, parquet_file):
+        written.append(parquet_file)
+    return written
+
+
+def read_columnar(filename='all_exoplanets.columns.bin', columns=None):
+    """Decode the binary layout back into {column: list}; mainly for checks and tooling"""
+    with open(filename, 'rb') as f:
+        blob = f.read()
+    if blob[:4] != MAGIC:
+        raise ValueError(f"{filename} is not a columnar exoplanet file")
+    header_length = struct.unpack('<I', blob[4:8])[0]
+    header = json.loads(blob[8:8 + header_length])
+    base = 8 + header_length
+
+    result = {}
+    for column in header['columns']:
+        if columns is not None and column['name'] not in columns:
+            continue
+        data = blob[base + column['offset']:base + column['offset'] + column['length']]
+        if column['kind'] == 'float64':
+            values = from_little_endian('d', data)
+            result[column['name']] = [None if v != v else v for v in values]
+        elif column['kind'] == 'category':
+            codes = from_little_endian(CATEGORY_TYPECODES[column['dtype']], data)
+            result[column['name']] = [column['dictionary'][code] for code in codes]
+        else:
+            offsets = from_little_endian('I', data[:column['offsets']])
+            text = data[column['offsets']:]
+            result[column['name']] = [text[offsets[i]:offsets[i + 1]].decode('utf-8')
+                                      for i in range(header['rows'])]
+    return result
@@ -0,0 +1,177 @@
+# crawler.py
+"""
+Bounded multi-page crawler built on nasa_exoplanets_scraper.parse_page
+- Breadth-first frontier from a start URL, following in-domain links to max_depth
+- URLs are normalized (fragment dropped, scheme/host lowercased, default ports removed)
+  and kept in a visited set so every page is fetched once
+- Pages are fetched concurrently through ConcurrentFetcher (per-host slots, token bucket,
+  robots.txt rules and Crawl-delay)
+- Fetched HTML is handed to a process pool of parse_page workers while the fetch threads
+  keep downloading; a bounded parse backlog stops new fetches until the workers catch up
+- Each parsed page is appended to a newline-delimited JSON file as soon as it arrives,
+  so memory does not grow with the size of the crawl
+"""
+
+import argparse
+import json
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from urllib.parse import urldefrag, urlparse, urlunparse
+
+from atomic_io import fsync_directory
+from fetcher import ConcurrentFetcher
+from nasa_exoplanets_scraper import BASE_URL, HEADERS, PARSER, parse_page
+from robots import ROBOTS_CACHE
+
+DEFAULT_OUTPUT = 'crawl_results.ndjson'
+SKIPPED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.pdf', '.zip',
+                      '.mp3', '.mp4', '.mov', '.csv', '.xml', '.json')
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url):
+    """Canonical form used for the visited set, or None for non-HTTP links"""
+    url, _ = urldefrag(url.strip())
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parsed.hostname:
+        return None
+    netloc = parsed.hostname.lower()
+    if parsed.port and parsed.port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{parsed.port}"
+    return urlunparse((scheme, netloc, parsed.path or '/', '', parsed.query, ''))
+
+
+def read_html(response):
+    """Fetch handler: (final url, html) for HTML responses, None for anything else"""
+    if 'html' not in response.headers.get('Content-Type', 'text/html').lower():
+        return None
+    return response.url, response.text
+
+
+class Crawler:
+    """Breadth-first crawl of one site, bounded by depth and page count"""
+
+    def __init__(self, start_url=BASE_URL, max_depth=2, max_pages=100, fetcher=None,
+                 robots=ROBOTS_CACHE, max_workers=4, parse_workers=None, parser=PARSER):
+        self.start_url = normalize_url(start_url)
+        self.domain = urlparse(self.start_url).netloc
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.fetcher = fetcher or ConcurrentFetcher(max_workers=max_workers, per_host=2, rate=2.0, burst=4,
+                                                    user_agent=HEADERS['User-Agent'])
+        self.robots = robots
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.parser = parser
+        # Downloaded pages allowed to wait for a parser before fetching pauses
+        self.parse_backlog = self.parse_workers * 2
+        self.visited = set()
+        self.frontier = deque()
+
+    def should_follow(self, url):
+        if url is None or url in self.visited:
+            return False
+        parsed = urlparse(url)
+        if parsed.netloc != self.domain or parsed.path.lower().endswith(SKIPPED_EXTENSIONS):
+            return False
+        return self.robots.allowed(url, self.fetcher.session)
+
+    def enqueue(self, url, depth):
+        url = normalize_url(url)
+        if len(self.visited) < self.max_pages and self.should_follow(url):
+            self.visited.add(url)
+            self.frontier.append((url, depth))
+
+    def crawl(self, out_file=DEFAULT_OUTPUT):
+        """Run the crawl, appending one JSON object per page to out_file; returns the page count"""
+        self.robots.apply_crawl_delay(self.start_url, self.fetcher.session, self.fetcher)
+        self.enqueue(self.start_url, 0)
+
+        pages = errors = 0
+        # Pages are appended to a .part file as they are parsed, so progress is visible and an
+        # interrupted crawl keeps what it already fetched; out_file appears once the crawl completes
+        tmp_file = out_file + '.part'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as out, \
+                    ThreadPoolExecutor(max_workers=self.fetcher.max_workers) as fetch_pool, \
+                    ProcessPoolExecutor(max_workers=self.parse_workers) as parse_pool:
+                fetching = {}
+                parsing = {}
+                while self.frontier or fetching or parsing:
+                    # Backpressure: only download more while the parse backlog has room
+                    while (self.frontier and len(fetching) < self.fetcher.max_workers * 2
+                           and len(parsing) < self.parse_backlog):
+                        url, depth = self.frontier.popleft()
+                        fetching[fetch_pool.submit(self.fetcher.fetch, url, read_html, 15)] = (url, depth)
+
+                    done, _ = wait([*fetching, *parsing], return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future in fetching:
+                            url, depth = fetching.pop(future)
+                            try:
+                                fetched = future.result()
+                            except Exception as e:
+                                errors += 1
+                                print(f"⚠️  {url}: {e}")
+                                continue
+                            if fetched is not None:
+                                final_url, html = fetched
+                                parsing[parse_pool.submit(parse_page, html, final_url, self.parser)] = (final_url, depth)
+                            continue
+
+                        url, depth = parsing.pop(future)
+                        try:
+                            page = future.result()
+                        except Exception as e:
+                            errors += 1
+                            print(f"⚠️  {url}: could not parse ({e})")
+                            continue
+                        page['depth'] = depth
+                        out.write(json.dumps(page, ensure_ascii=False) + '\n')
+                        out.flush()
+                        pages += 1
+
+                        if depth < self.max_depth:
+                            for link in page['links']:
+                                self.enqueue(link['href'], depth + 1)
+        except BaseException:
+            print(f"⚠️  Crawl stopped early; the {pages} pages crawled so far are in {tmp_file}")
+            raise
+        os.replace(tmp_file, out_file)
+        fsync_directory(os.path.dirname(os.path.abspath(out_file)))
+
+        print(f"🕸️  Crawled {pages} pages ({errors} errors) into {out_file}")
+        return pages
+
+
+def iter_pages(filename=DEFAULT_OUTPUT):
+    """Read a crawl back one page at a time"""
+    with open(filename, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Crawl NASA exoplanet pages into NDJSON')
+    parser.add_argument('--url', default=BASE_URL, help='start URL')
+    parser.add_argument('--depth', type=int, default=2, help='how many links away from the start page to follow')
+    parser.add_argument('--max-pages', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=4, help='concurrent downloads')
+    parser.add_argument('--parse-workers', type=int, default=None, help='parser processes (default: CPU count)')
+    parser.add_argument('--out', default=DEFAULT_OUTPUT)
+    parser.add_argument('--parser', default=PARSER, choices=['html.parser', 'lxml'],
+                        help='BeautifulSoup tree builder (lxml is faster but treats malformed HTML differently)')
+    args = parser.parse_args(argv)
+
+    crawler = Crawler(args.url, max_depth=args.depth, max_pages=args.max_pages, max_workers=args.workers,
+                      parse_workers=args.parse_workers, parser=args.parser)
+    try:
+        crawler.crawl(args.out)
+    finally:
+        crawler.fetcher.close()
+
+
+if __name__ == '__main__':
+    main()
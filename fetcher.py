@@ -0,0 +1,142 @@
+# fetcher.py
+"""
+Concurrent fetch layer shared by the exoplanet scrapers
+- One pooled requests.Session reused by every worker thread, backed by the on-disk HTTP cache
+- Per-host concurrency limit so one server never sees more than N requests at once
+- Token-bucket rate limiter per host instead of fixed sleeps between requests
+- Results come back in submission order so downstream dedup stays deterministic
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from http_cache import ResponseCache, mount_cache
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (compatible; ExoplanetResearch/1.0)'
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, up to `capacity` banked"""
+
+    def __init__(self, rate=1.0, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def set_rate(self, rate):
+        with self.lock:
+            self._refill()
+            self.rate = rate
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate if self.rate > 0 else 1.0
+            time.sleep(wait)
+
+
+def make_pooled_session(user_agent=DEFAULT_USER_AGENT, pool_size=10, cache=True):
+    """Session whose connection pool is large enough for every worker thread.
+
+    With `cache` (True or a ResponseCache) responses go through the on-disk
+    HTTP cache, so unchanged TAP results are revalidated instead of re-downloaded.
+    """
+    session = requests.Session()
+    if cache:
+        cache = cache if isinstance(cache, ResponseCache) else ResponseCache()
+        mount_cache(session, cache, pool_connections=pool_size, pool_maxsize=pool_size)
+    else:
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    session.headers.update({'User-Agent': user_agent})
+    return session
+
+
+class ConcurrentFetcher:
+    """Issue GET requests concurrently over a shared session with politeness limits"""
+
+    def __init__(self, session=None, max_workers=4, per_host=2, rate=1.0, burst=2,
+                 user_agent=DEFAULT_USER_AGENT, cache=True):
+        self.session = session or make_pooled_session(user_agent, pool_size=max_workers, cache=cache)
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.rate = rate
+        self.burst = burst
+        self.host_slots = {}
+        self.host_buckets = {}
+        self.lock = threading.Lock()
+
+    def _host_state(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.host_slots:
+                self.host_slots[host] = threading.BoundedSemaphore(self.per_host)
+                self.host_buckets[host] = TokenBucket(self.rate, self.burst)
+            return self.host_slots[host], self.host_buckets[host]
+
+    def bucket_for(self, url):
+        """Token bucket used for the host of `url` (e.g. to apply a Crawl-delay)"""
+        return self._host_state(url)[1]
+
+    @contextmanager
+    def throttle(self, url):
+        """Hold a per-host slot and a rate-limit token for the duration of the block"""
+        slot, bucket = self._host_state(url)
+        with slot:
+            bucket.acquire()
+            yield
+
+    def fetch(self, url, handler=None, timeout=30, **kwargs):
+        """Fetch one URL under the host limits; return handler(response) or the response"""
+        with self.throttle(url):
+            response = self.session.get(url, timeout=timeout, **kwargs)
+            response.raise_for_status()
+            return handler(response) if handler else response
+
+    def fetch_all(self, urls, handler=None, timeout=30, window=None):
+        """Fetch every URL concurrently.
+
+        Yields (index, url, result, error) in submission order; exactly one of
+        result/error is set for each URL. With `window`, at most that many URLs are
+        in flight or finished-but-unconsumed at once, which bounds the memory held
+        by results the caller hasn't reached yet.
+        """
+        urls = list(urls)
+        window = window or len(urls)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = deque(pool.submit(self.fetch, url, handler, timeout) for url in urls[:window])
+            for i, url in enumerate(urls):
+                future = futures.popleft()
+                try:
+                    result, error = future.result(), None
+                except Exception as e:
+                    result, error = None, e
+                # Drop the future's reference to the result before refilling the window
+                del future
+                if i + window < len(urls):
+                    futures.append(pool.submit(self.fetch, urls[i + window], handler, timeout))
+                yield i, url, result, error
+                result = None
+
+    def close(self):
+        self.session.close()
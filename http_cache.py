@@ -0,0 +1,259 @@
+# http_cache.py
+"""
+Persistent on-disk HTTP response cache for the scrapers' requests sessions
+- Keyed by method + full URL (so each TAP query is its own entry)
+- Fresh entries (Cache-Control max-age, or a TTL the caller opts into) are served without
+  a request; responses without cache headers are always revalidated or refetched, since
+  TAP sync results carry none and must never come back stale
+- Stale entries are revalidated with If-None-Match / If-Modified-Since; a 304 reuses the body
+- A request sent with Cache-Control: no-cache (or max-age=0) always revalidates, even
+  when its entry is fresh (used by change probes that must see the server's answer)
+- Bodies are streamed to disk in chunks; streamed requests read them back from the
+  file (closed once consumed), so large TAP responses never have to fit in memory
+- Size-bounded with least-recently-used eviction
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+CACHE_DIR = '.http_cache'
+# Freshness for responses without Cache-Control; callers may opt into more (default_ttl / ttl)
+DEFAULT_TTL = 0
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+# Headers that describe the wire encoding, which no longer applies to the decoded body on disk
+DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class CachedBody(io.BufferedReader):
+    """Raw body of a cached response; closes its file at end of body, as urllib3 does"""
+
+    def read(self, size=-1):
+        data = super().read(size)
+        if not data or size is None or size < 0:
+            self.close()
+        return data
+
+
+def cache_key(method, url):
+    return hashlib.sha256(f"{method} {url}".encode('utf-8')).hexdigest()
+
+
+def max_age(headers, default):
+    """Seconds the response may be served without revalidation; None means don't store"""
+    directives = [d.strip().lower() for d in headers.get('Cache-Control', '').split(',') if d.strip()]
+    if 'no-store' in directives:
+        return None
+    if 'no-cache' in directives:
+        return 0
+    for directive in directives:
+        if directive.startswith('max-age='):
+            try:
+                return int(directive.split('=', 1)[1])
+            except ValueError:
+                break
+    return default
+
+
+class ResponseCache:
+    """Directory of <key>.json metadata + <key>.body files"""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, default_ttl=DEFAULT_TTL):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def lookup(self, key):
+        meta_path, body_path = self.paths(key)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(body_path):
+            return None
+        return meta
+
+    def is_fresh(self, meta):
+        return time.time() < meta['stored_at'] + meta['ttl']
+
+    def touch(self, key):
+        """Mark an entry as recently used (eviction is by body mtime)"""
+        for path in self.paths(key):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+    def write_meta(self, key, meta):
+        meta_path, _ = self.paths(key)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp, meta_path)
+
+    def store(self, key, response, ttl):
+        """Stream a live response body to disk and record its metadata"""
+        _, body_path = self.paths(key)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        size = 0
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in response.raw.stream(CHUNK_SIZE, decode_content=True):
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(tmp, body_path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        finally:
+            response.close()
+
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS}
+        meta = {
+            'url': response.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': headers,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'stored_at': time.time(),
+            'ttl': ttl,
+            'size': size
+        }
+        self.write_meta(key, meta)
+        self.evict()
+        return meta
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if name.endswith('.body'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name[:-len('.body')]))
+                total += stat.st_size
+        entries.sort()
+        while total > self.max_bytes and entries:
+            _, size, key = entries.pop(0)
+            for path in self.paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+
+
+class CachingAdapter(HTTPAdapter):
+    """HTTPAdapter that answers GETs from a ResponseCache and revalidates stale entries.
+
+    Responses carry `from_cache` (served without a full transfer) and
+    `revalidated` (a 304 confirmed the cached body) attributes.
+    """
+
+    def __init__(self, cache=None, ttl=None, **kwargs):
+        self.cache = cache or ResponseCache()
+        self.ttl = ttl
+        super().__init__(**kwargs)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if request.method != 'GET':
+            return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        key = cache_key(request.method, request.url)
+        meta = self.cache.lookup(key)
+        # Request-side no-cache / max-age=0: the caller needs the server's current answer
+        must_revalidate = max_age(request.headers, None) == 0
+        if meta and self.cache.is_fresh(meta) and not must_revalidate:
+            self.cache.touch(key)
+            return self.build_cached(request, key, meta, revalidated=False, stream=stream)
+
+        if meta:
+            if meta.get('etag'):
+                request.headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request.headers['If-Modified-Since'] = meta['last_modified']
+
+        response = super().send(request, stream=True, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        if response.status_code == 304 and meta:
+            response.close()
+            meta['stored_at'] = time.time()
+            meta['ttl'] = self.entry_ttl(response.headers, meta['ttl'])
+            self.cache.write_meta(key, meta)
+            self.cache.touch(key)
+            return self.build_cached(request, key, meta, revalidated=True, stream=stream)
+
+        ttl = self.entry_ttl(response.headers)
+        # Without freshness or a validator a stored body could never be reused
+        reusable = ttl or response.headers.get('ETag') or response.headers.get('Last-Modified')
+        if response.status_code != 200 or ttl is None or not reusable:
+            response.from_cache = False
+            response.revalidated = False
+            return response
+
+        meta = self.cache.store(key, response, ttl)
+        cached = self.build_cached(request, key, meta, revalidated=False, stream=stream)
+        cached.from_cache = False
+        return cached
+
+    def entry_ttl(self, headers, default=None):
+        """TTL for a response: an explicit adapter ttl wins unless the server said no-store"""
+        ttl = max_age(headers, self.cache.default_ttl if default is None else default)
+        if ttl is not None and self.ttl is not None:
+            return self.ttl
+        return ttl
+
+    def build_cached(self, request, key, meta, revalidated, stream=False):
+        """Response for a cache entry; the body is read up front unless `stream` is set"""
+        _, body_path = self.cache.paths(key)
+        response = requests.Response()
+        response.status_code = meta['status']
+        response.reason = meta.get('reason')
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.headers['Content-Length'] = str(meta['size'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        if stream:
+            response.raw = CachedBody(io.FileIO(body_path))
+        else:
+            with open(body_path, 'rb') as f:
+                response._content = f.read()
+            response._content_consumed = True
+        response.url = meta['url']
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        response.revalidated = revalidated
+        return response
+
+
+def mount_cache(session, cache=None, **adapter_kwargs):
+    """Mount a CachingAdapter for http and https on an existing session"""
+    adapter = CachingAdapter(cache=cache, **adapter_kwargs)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,60 +1,47 @@
 # nasa_exoplanets_scraper.py
 """
 Scraper for https://science.nasa.gov/exoplanets/
-- Respects robots.txt (simple check)
+- Respects robots.txt (Allow/Disallow with wildcards, cached per host)
 - Extracts title, meta description, headings (h1-h4), paragraphs, images, links
 - Saves JSON to results.json and generates results.html (self-contained viewer)
 """
 
 import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 import json
 import sys
 from requests.adapters import HTTPAdapter, Retry
 
+from atomic_io import write_json, write_text
+from http_cache import ResponseCache, mount_cache
+from robots import ROBOTS_CACHE
+
 BASE_URL = "https://science.nasa.gov/exoplanets/"
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; MyScraper/1.0; +https://example.com/bot)",
 }
 
 
-def make_session(retries=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)):
+def make_session(retries=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), cache=True):
     s = requests.Session()
     retries = Retry(total=retries, backoff_factor=backoff_factor,
                     status_forcelist=status_forcelist,
                     allowed_methods=frozenset(['GET','HEAD']))
-    s.mount("https://", HTTPAdapter(max_retries=retries))
-    s.mount("http://", HTTPAdapter(max_retries=retries))
+    if cache:
+        # Unchanged pages and robots.txt cost a 304 instead of a full download
+        cache = cache if isinstance(cache, ResponseCache) else ResponseCache()
+        mount_cache(s, cache, max_retries=retries)
+    else:
+        s.mount("https://", HTTPAdapter(max_retries=retries))
+        s.mount("http://", HTTPAdapter(max_retries=retries))
     s.headers.update(HEADERS)
     return s
 
 
-def allowed_by_robots(target_url, session):
-    parsed = urlparse(target_url)
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-    try:
-        r = session.get(robots_url, timeout=10)
-        if r.status_code != 200:
-            return True
-        text = r.text.splitlines()
-        applicable = False
-        disallows = []
-        for line in text:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if line.lower().startswith('user-agent:'):
-                user_agent = line.split(':',1)[1].strip()
-                applicable = (user_agent == '*' or 'myscraper' in user_agent.lower())
-            elif applicable and line.lower().startswith('disallow:'):
-                path = line.split(':',1)[1].strip()
-                disallows.append(path)
-        if '/' in disallows:
-            return False
-        return True
-    except Exception:
-        return True
+def allowed_by_robots(target_url, session, robots=ROBOTS_CACHE):
+    """robots.txt check; each host's rules are fetched and compiled once (see robots.py)"""
+    return robots.allowed(target_url, session)
 
 
 def fetch(url, session, timeout=15):
@@ -63,8 +50,14 @@ def fetch(url, session, timeout=15):
     return resp
 
 
-def parse_page(html, base_url):
-    soup = BeautifulSoup(html, 'html.parser')
+# html.parser stays the default: lxml is faster but repairs unclosed tags differently
+# (e.g. <p>a<p>b), which changes the extracted text. Pass parser='lxml' to opt in.
+PARSER = 'html.parser'
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4'}
+
+
+def parse_page(html, base_url, parser=None):
+    soup = BeautifulSoup(html, parser or PARSER)
 
     title = soup.title.string.strip() if soup.title and soup.title.string else None
     meta_desc = None
@@ -80,32 +73,30 @@ def parse_page(html, base_url):
     if not main:
         main = soup.body or soup
 
+    # One walk over main collects every kind of element, each list in document order
     headings = []
-    for h in main.find_all(['h1','h2','h3','h4']):
-        text = h.get_text(separator=' ', strip=True)
-        if text:
-            headings.append({'tag': h.name, 'text': text})
-
     paragraphs = []
-    for p in main.find_all('p'):
-        txt = p.get_text(separator=' ', strip=True)
-        if txt:
-            paragraphs.append(txt)
-
     images = []
-    for img in main.find_all('img'):
-        src = img.get('src') or img.get('data-src')
-        if not src:
-            continue
-        src = urljoin(base_url, src)
-        images.append({'src': src, 'alt': img.get('alt', '')})
-
     links = []
-    for a in main.find_all('a', href=True):
-        href = a['href'].strip()
-        full = urljoin(base_url, href)
-        text = a.get_text(separator=' ', strip=True)
-        links.append({'text': text, 'href': full})
+    for el in main.descendants:
+        name = el.name
+        if name is None:
+            continue
+        if name in HEADING_TAGS:
+            text = el.get_text(separator=' ', strip=True)
+            if text:
+                headings.append({'tag': name, 'text': text})
+        elif name == 'p':
+            txt = el.get_text(separator=' ', strip=True)
+            if txt:
+                paragraphs.append(txt)
+        elif name == 'img':
+            src = el.get('src') or el.get('data-src')
+            if src:
+                images.append({'src': urljoin(base_url, src), 'alt': el.get('alt', '')})
+        elif name == 'a' and el.get('href') is not None:
+            links.append({'text': el.get_text(separator=' ', strip=True),
+                          'href': urljoin(base_url, el['href'].strip())})
 
     return {
         'url': base_url,
@@ -225,23 +216,21 @@ def generate_html(data, out_file='results.html'):
     </html>
     """.replace('{safe_json}', safe_json)
 
-    with open(out_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+    write_text(out_file, html)
     print(f"Wrote {out_file}")
 
 
-def scrape_and_save(url=BASE_URL):
-    session = make_session()
+def scrape_and_save(url=BASE_URL, session=None, parser=None):
+    session = session or make_session()
     if not allowed_by_robots(url, session):
         print(f"Robots.txt disallows scraping {url}. Aborting.")
         return None
 
     r = fetch(url, session)
-    data = parse_page(r.text, url)
+    data = parse_page(r.text, url, parser)
 
     # Save JSON
-    with open('results.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    write_json('results.json', data, ensure_ascii=False, indent=2)
     print('Saved results.json')
 
     # Generate self-contained HTML viewer
@@ -252,7 +241,7 @@ def scrape_and_save(url=BASE_URL):
 
 if __name__ == '__main__':
     try:
-        data = scrape_and_save()
+        data = scrape_and_save(parser='lxml' if '--lxml' in sys.argv[1:] else None)
         if data is None:
             sys.exit(1)
         print('Done. Open results.html in your browser to view the data.')
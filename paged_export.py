@@ -0,0 +1,118 @@
+# paged_export.py
+"""
+Paged and sharded export of the exoplanet dataset for the planet list view
+- Splits the dataset into fixed-size pages (default 50, what the list view shows)
+- Adds per-type and per-habitability shards keyed by the `type`/`habitable` fields
+- Writes an index.json describing every collection, so the first screen needs one small page
+- Each export goes into a content-hashed directory (public/planets/<hash>/) that is
+  registered in data-manifest.json, so pages can be cached as immutable
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from datetime import datetime
+
+from atomic_io import write_text
+from publish import load_manifest, write_manifest
+
+PAGE_SIZE = 50
+INDEX_NAME = 'planets/index.json'
+
+
+def slugify(value):
+    return re.sub(r'[^a-z0-9]+', '-', str(value).lower()).strip('-') or 'unknown'
+
+
+def dump_compact(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_collection(root, key, planets, page_size):
+    """Write one collection as page-0001.json, page-0002.json, ...; returns its index entry"""
+    directory = os.path.join(root, *key.split('/'))
+    os.makedirs(directory, exist_ok=True)
+    total = len(planets)
+    pages = max(1, -(-total // page_size))
+    files = []
+    for page in range(1, pages + 1):
+        chunk = planets[(page - 1) * page_size:page * page_size]
+        filename = f"page-{page:04d}.json"
+        write_text(os.path.join(directory, filename),
+                   dump_compact({'collection': key, 'page': page, 'pages': pages,
+                                 'page_size': page_size, 'total': total, 'planets': chunk}))
+        files.append(f"{key}/{filename}")
+    return {'total': total, 'pages': pages, 'page_size': page_size, 'files': files}
+
+
+def group_by(planets, field):
+    groups = {}
+    for planet in planets:
+        groups.setdefault(planet.get(field) or 'Unknown', []).append(planet)
+    return groups
+
+
+def prune_old_exports(planets_dir, current, keep):
+    versions = [os.path.join(planets_dir, name) for name in os.listdir(planets_dir)
+                if os.path.isdir(os.path.join(planets_dir, name))]
+    versions.sort(key=os.path.getmtime, reverse=True)
+    for old in [v for v in versions if os.path.basename(v) != current][max(keep - 1, 0):]:
+        shutil.rmtree(old)
+
+
+def export_pages(planets, public_dir, page_size=PAGE_SIZE, keep=2, manifest=None):
+    """Write pages, shards and index under public_dir/planets/<hash>/; returns the manifest entry.
+
+    As with publish.publish_file, passing a `manifest` dict only records the entry
+    in it: the caller writes the manifest once and then prunes old exports.
+    """
+    digest = hashlib.sha256(dump_compact([page_size, planets]).encode('utf-8')).hexdigest()[:12]
+    planets_dir = os.path.join(public_dir, 'planets')
+    root = os.path.join(planets_dir, digest)
+
+    collections = {'all': write_collection(root, 'all', planets, page_size)}
+    for field, prefix in (('type', 'type'), ('habitable', 'habitable')):
+        for value, members in sorted(group_by(planets, field).items()):
+            entry = write_collection(root, f"{prefix}/{slugify(value)}", members, page_size)
+            entry['value'] = value
+            collections[f"{prefix}/{slugify(value)}"] = entry
+
+    index = {
+        'version': digest,
+        'base': f"/planets/{digest}/",
+        'generated': datetime.now().isoformat(),
+        'total': len(planets),
+        'collections': collections
+    }
+    index_path = os.path.join(root, 'index.json')
+    write_text(index_path, dump_compact(index))
+
+    entry = {
+        'path': f"/planets/{digest}/index.json",
+        'hash': digest,
+        'bytes': os.path.getsize(index_path)
+    }
+    if manifest is None:
+        manifest = load_manifest(public_dir)
+        manifest.setdefault('files', {})[INDEX_NAME] = entry
+        write_manifest(public_dir, manifest)
+        prune_old_exports(planets_dir, digest, keep)
+    else:
+        manifest.setdefault('files', {})[INDEX_NAME] = entry
+
+    print(f"📄 Exported {len(planets)} planets as {collections['all']['pages']} pages "
+          f"and {len(collections) - 1} shards to {root}")
+    return entry
+
+
+def export_pages_from_file(json_file='all_exoplanets.json', public_dir=None, page_size=PAGE_SIZE, manifest=None):
+    """Paginate a saved dataset into the repo's public/ directory"""
+    public_dir = public_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'public')
+    if not os.path.isdir(public_dir):
+        print(f"⚠️ Public directory not found: {public_dir}")
+        return None
+    with open(json_file, encoding='utf-8') as f:
+        planets = json.load(f).get('exoplanets', [])
+    return export_pages(planets, public_dir, page_size, manifest=manifest)
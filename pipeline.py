@@ -0,0 +1,379 @@
+# pipeline.py
+"""
+Shared scraping pipeline for the NASA Exoplanet Archive scrapers
+- A Pipeline is a source generator followed by stages that each take and return an
+  iterator, so rows stream from the TAP response through dedup and processing into the sink
+- Stock sources: JSON endpoints fetched concurrently, CSV endpoints streamed with a fallback,
+  a table downloaded in concurrent key-range partitions (tap_partitions)
+- Stock stages: best-solution dedup of raw rows, vectorized processing (batch_processing),
+  first-seen dedup of processed planets
+- Descriptions are generated last, so only planets that survive dedup get one, and can be
+  left out of the export entirely (the app renders them from src/planetDescription.js)
+- ExoplanetScraper holds the one copy of process_planet_data and its helpers plus the
+  JSON sinks; each scraper script is a configuration of it (table, stages, metadata)
+- Its default pipeline is the one hot path every scraper shares: one table streamed as CSV
+  (only the columns the archive has, with the minimal ps query as fallback), best solution
+  per planet, vectorized processing
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+
+from atomic_io import atomic_write, write_json
+from batch_processing import iter_processed_batches
+from fetcher import ConcurrentFetcher
+from planet_dedup import best_solutions
+from planet_records import compact_all, record_to_json
+from publish import publish_files
+from tap_partitions import fetch_partitioned
+from tap_query import (DISCOVERY_COLUMNS, HOST_COLUMN, MINIMAL_COLUMNS, NAME_COLUMN, archive_columns,
+                       field_values, query_url)
+from tap_stream import stream_tap_rows
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (compatible; ExoplanetResearch/1.0)'
+
+
+class Pipeline:
+    """source() -> stage -> stage -> ... ; iterate it, or hand it to a sink with into()"""
+
+    def __init__(self, source, *stages):
+        self.source = source
+        self.stages = stages
+
+    def __iter__(self):
+        stream = self.source()
+        for stage in self.stages:
+            stream = stage(stream)
+        return iter(stream)
+
+    def into(self, sink):
+        return sink(iter(self))
+
+
+# --- sources -----------------------------------------------------------------
+
+def json_endpoints_source(fetcher, endpoints):
+    """Fetch JSON TAP endpoints; yield their rows in endpoint order, one response in memory at a time"""
+    def source():
+        # The fetcher's per-host limit and rate limiter keep us respectful to the API; a window
+        # of 1 means the next response is only downloaded once this one's rows are consumed
+        results = fetcher.fetch_all(endpoints, handler=lambda response: response.json(), window=1)
+        for i, endpoint, data, error in results:
+            if error is not None:
+                print(f"  ❌ Error with endpoint {i+1}: {error}")
+                continue
+            print(f"  ✅ Retrieved {len(data)} exoplanets from endpoint {i+1}/{len(endpoints)}")
+            yield from data
+    return source
+
+
+def csv_endpoints_source(fetcher, endpoints, fallback=None):
+    """Stream CSV TAP endpoints row by row; on failure switch to `fallback` and stop"""
+    def stream(endpoint):
+        count = 0
+        with fetcher.throttle(endpoint):
+            for row in stream_tap_rows(fetcher.session, endpoint):
+                count += 1
+                yield row
+        return count
+
+    def source():
+        for i, endpoint in enumerate(endpoints):
+            try:
+                print(f"  📡 Fetching from endpoint {i+1}/{len(endpoints)}...")
+                count = yield from stream(endpoint)
+                print(f"  ✅ Retrieved {count} exoplanets")
+            except Exception as e:
+                print(f"  ❌ Error with endpoint {i+1}: {e}")
+                if fallback is None:
+                    continue
+                try:
+                    print(f"  🔄 Trying alternative endpoint...")
+                    count = yield from stream(fallback)
+                    print(f"  ✅ Retrieved {count} exoplanets from alternative")
+                    break
+                except Exception as e2:
+                    print(f"  ❌ Alternative also failed: {e2}")
+                    continue
+    return source
+
+
+def partitioned_source(fetcher, table, partitions=None, extra_columns=(), where=None, available=None):
+    """Download `table` in key-range partitions, concurrently; rows come in partition order"""
+    def source():
+        print(f"  📡 Fetching {table} in partitions...")
+        yield from fetch_partitioned(fetcher, table, partitions, extra_columns, where, available=available)
+    return source
+
+
+# --- stages ------------------------------------------------------------------
+
+def process_stage(processor, batch_size=5000):
+    """Raw rows -> planet dicts, vectorized in batches"""
+    return lambda rows: iter_processed_batches(rows, processor, batch_size)
+
+
+def best_solution_stage(rows):
+    """Keep the most complete, most recent solution per planet (sorted by name)"""
+    return best_solutions(rows)
+
+
+def unique_by_name(planets):
+    """Keep the first planet seen for each name"""
+    seen = set()
+    for planet in planets:
+        if planet['name'] not in seen:
+            seen.add(planet['name'])
+            yield planet
+
+
+# --- scraper configuration ---------------------------------------------------
+
+class ExoplanetScraper:
+    """Shared planet processing and sinks; subclasses configure the pipeline"""
+
+    USER_AGENT = DEFAULT_USER_AGENT
+    # Table streamed by the default source; pscomppars holds exactly one row per planet
+    TABLE = 'pscomppars'
+    EXTRA_COLUMNS = ['rowupdate']
+    WHERE = None
+    # Fallback: the original minimal query, which still works if the full one does not
+    ALT_ENDPOINT = query_url('ps', 'csv', available=MINIMAL_COLUMNS)
+    DEFAULT_FILE = 'all_exoplanets.json'
+    SOURCE = 'NASA Exoplanet Archive'
+    DESCRIPTION = None
+
+    def __init__(self, fetcher=None, include_descriptions=True):
+        self.fetcher = fetcher or ConcurrentFetcher(user_agent=self.USER_AGENT)
+        self.session = self.fetcher.session
+        # False: write planets without generated descriptions (the client templates them)
+        self.include_descriptions = include_descriptions
+        self.exoplanets = []
+
+    def available_columns(self):
+        """Columns TABLE really has, so the query never names one the archive rejects"""
+        return archive_columns(self.session, self.TABLE)
+
+    def source(self):
+        endpoint = query_url(self.TABLE, 'csv', self.EXTRA_COLUMNS, self.WHERE, available=self.available_columns())
+        return csv_endpoints_source(self.fetcher, [endpoint], fallback=self.ALT_ENDPOINT)
+
+    def stages(self):
+        """Keep the best solution per planet (sorted by name), then process in batches"""
+        return [best_solution_stage, process_stage(self)]
+
+    def pipeline(self):
+        return Pipeline(self.source(), *self.stages(), self.describe_planets)
+
+    def iter_processed_planets(self):
+        print("🔍 Scraping NASA Exoplanet Archive...")
+        return iter(self.pipeline())
+
+    def scrape_nasa_archive(self):
+        """Run the pipeline into self.exoplanets (compact PlanetRecords, not dicts)"""
+        self.exoplanets = compact_all(self.iter_processed_planets())
+        print(f"🎯 Total unique exoplanets: {len(self.exoplanets)}")
+        return self.exoplanets
+
+    def scrape_to_file(self, filename=None):
+        """Streaming mode: fetch, dedup, process and write without holding the archive in memory"""
+        filename, count = self.save_data_stream(self.iter_processed_planets(), filename or self.DEFAULT_FILE)
+        print(f"🎯 Total unique exoplanets: {count}")
+        return filename, count
+
+    # --- per-row processing (the batch path in batch_processing matches it exactly)
+
+    def process_planet_data(self, raw_data):
+        """Process raw planet data into standardized format (fields per tap_query's schema)"""
+        try:
+            # Extract basic information
+            name = raw_data.get(NAME_COLUMN, '')
+            hostname = raw_data.get(HOST_COLUMN, 'Unknown')
+
+            if not name or name == 'Unknown':
+                return None
+
+            # Values copied straight from the archive row
+            values = field_values(raw_data)
+            radius_earth = values['radius_earth']
+            mass_earth = values['mass_earth']
+
+            # Rows with a null radius or mass are skipped, as they were when the
+            # description (which compares both against zero) was built here
+            if not isinstance(radius_earth, (int, float)) or not isinstance(mass_earth, (int, float)):
+                return None
+
+            return {
+                'name': name,
+                'host_star': hostname,
+                'type': self.classify_planet_type(radius_earth, mass_earth, values['mass_jupiter']),
+                'habitable': self.determine_habitability(values['insolation_earth'], radius_earth),
+                **values,
+                'discovery_method': self.determine_discovery_method(raw_data)
+            }
+
+        except Exception as e:
+            print(f"  ⚠️ Error processing planet {raw_data.get(NAME_COLUMN, 'Unknown')}: {e}")
+            return None
+
+    def determine_habitability(self, insolation, radius):
+        """Determine if planet is in habitable zone"""
+        try:
+            if insolation > 0 and 0.3 <= insolation <= 1.7:
+                if radius > 0 and 0.5 <= radius <= 2.0:
+                    return 'Yes'
+            return 'No'
+        except:
+            return 'Unknown'
+
+    def classify_planet_type(self, radius_earth, mass_earth, mass_jupiter):
+        """Classify planet type based on size and mass"""
+        try:
+            if radius_earth > 0:
+                if radius_earth < 0.8:
+                    return 'Sub-Earth'
+                elif radius_earth < 1.25:
+                    return 'Terrestrial'
+                elif radius_earth < 2.0:
+                    return 'Super Earth'
+                elif radius_earth < 6.0:
+                    return 'Mini Neptune'
+                else:
+                    return 'Gas Giant'
+            elif mass_jupiter > 0:
+                if mass_jupiter < 0.1:
+                    return 'Super Earth'
+                elif mass_jupiter < 0.5:
+                    return 'Neptune-like'
+                else:
+                    return 'Jupiter-like'
+            else:
+                return 'Unknown'
+        except:
+            return 'Unknown'
+
+    def determine_discovery_method(self, data):
+        """Determine primary discovery method"""
+        # A null (not measured) counts as not detected, like a column the query didn't return
+        methods = [method for column, method in DISCOVERY_COLUMNS
+                   if data.get(column) is not None and data.get(column) > 0]
+        return ', '.join(methods) if methods else 'Unknown'
+
+    def describe_planets(self, planets):
+        """Final stage: add the generated description, or drop it if include_descriptions is off"""
+        for planet in planets:
+            if not self.include_descriptions:
+                planet.pop('description', None)
+            elif 'description' not in planet:
+                planet['description'] = self.generate_description(
+                    planet['name'], planet['type'], planet['habitable'],
+                    planet['radius_earth'], planet['mass_earth'])
+            yield planet
+
+    def generate_description(self, name, planet_type, habitable, radius, mass):
+        """Generate a description for the planet (keep in step with src/planetDescription.js)"""
+        desc_parts = [f"{name} is a {planet_type.lower()} exoplanet"]
+
+        if radius > 0:
+            desc_parts.append(f"with a radius of {radius:.2f} Earth radii")
+
+        if mass > 0:
+            desc_parts.append(f"and a mass of {mass:.2f} Earth masses")
+
+        if habitable == 'Yes':
+            desc_parts.append("located within the habitable zone of its star")
+        elif habitable == 'No':
+            desc_parts.append("located outside the habitable zone")
+
+        return '. '.join(desc_parts) + '.'
+
+    # --- sinks
+
+    def build_metadata(self, total):
+        """Metadata block written at the top of the JSON file"""
+        metadata = {
+            'total_exoplanets': total,
+            'scrape_date': datetime.now().isoformat(),
+            'source': self.SOURCE,
+            'version': '1.0'
+        }
+        if self.DESCRIPTION:
+            metadata['description'] = self.DESCRIPTION
+        return metadata
+
+    def save_data(self, filename=None):
+        """Save all exoplanet data to JSON file"""
+        filename = filename or self.DEFAULT_FILE
+        data = {
+            'metadata': self.build_metadata(len(self.exoplanets)),
+            'exoplanets': self.exoplanets
+        }
+
+        write_json(filename, data, indent=2, ensure_ascii=False, default=record_to_json)
+
+        print(f"💾 Saved {len(self.exoplanets)} exoplanets to {filename}")
+        return filename
+
+    def save_data_stream(self, planets, filename=None):
+        """Write planets from an iterator to the same JSON layout as save_data.
+
+        Planets are spooled to a side file first so the total count can go in
+        the metadata header; only one planet is in memory at any time.
+        """
+        filename = filename or self.DEFAULT_FILE
+        spool_file = filename + '.part'
+        count = 0
+        try:
+            with open(spool_file, 'w', encoding='utf-8') as spool:
+                for planet in planets:
+                    spool.write(',\n    ' if count else '\n    ')
+                    spool.write(json.dumps(planet, indent=2, ensure_ascii=False).replace('\n', '\n    '))
+                    count += 1
+
+            metadata = json.dumps(self.build_metadata(count), indent=2, ensure_ascii=False)
+            with atomic_write(filename) as f, open(spool_file, encoding='utf-8') as spool:
+                f.write('{\n  "metadata": ' + metadata.replace('\n', '\n  ') + ',\n  "exoplanets": [')
+                shutil.copyfileobj(spool, f)
+                f.write('\n  ]\n}' if count else ']\n}')
+        finally:
+            if os.path.exists(spool_file):
+                os.remove(spool_file)
+
+        print(f"💾 Saved {count} exoplanets to {filename}")
+        return filename, count
+
+
+def run_scraper(scraper, title):
+    """Entry point shared by the scraper scripts: scrape to disk, publish, report"""
+    print(f"🌌 {title}")
+    print("=" * 50)
+
+    try:
+        # Scrape all exoplanets straight to disk
+        filename, total = scraper.scrape_to_file()
+
+        if total:
+            # Publish minified, hashed and pre-compressed copies to the React public directory
+            if publish_files([filename]):
+                print("📁 Data published to React public directory")
+
+            print(f"\n🎉 Successfully scraped {total} exoplanets!")
+            print("📊 Data includes:")
+            print(f"  - Planet names and classifications")
+            print(f"  - Physical properties (radius, mass, density)")
+            print(f"  - Orbital characteristics")
+            print(f"  - Atmospheric properties")
+            print(f"  - Habitable zone status")
+            print(f"  - Discovery methods")
+
+        else:
+            print("❌ No exoplanets found")
+            return False
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
+    return True
@@ -0,0 +1,65 @@
+# planet_dedup.py
+"""
+Deduplication of NASA Exoplanet Archive solutions
+- The `ps` table holds one row per published solution, so a planet appears many times
+- Keeps the best solution per `pl_name` instead of whichever row arrived first
+- Best = most filled-in fields, then latest `rowupdate`, then a stable tie-break
+- Emits planets sorted by name so output files are identical between runs
+"""
+
+import json
+
+
+def completeness(row):
+    """Number of columns that actually carry a value"""
+    return sum(1 for value in row.values() if value is not None and value != '')
+
+
+def solution_rank(row):
+    """Sort key for choosing between two solutions of the same planet"""
+    return (
+        completeness(row),
+        row.get('rowupdate') or '',
+        # Final tie-break on the row content itself so the choice never
+        # depends on the order the archive returned the rows in
+        json.dumps(row, sort_keys=True, default=str),
+    )
+
+
+class SolutionMerger:
+    """Collect raw archive rows and keep the best solution for each planet.
+
+    Memory is bounded by the number of distinct planets, not by the number
+    of rows streamed through `add`.
+    """
+
+    def __init__(self, key='pl_name'):
+        self.key = key
+        self.best = {}
+        self.rows_seen = 0
+
+    def add(self, row):
+        name = row.get(self.key)
+        if not name:
+            return
+        self.rows_seen += 1
+        rank = solution_rank(row)
+        current = self.best.get(name)
+        if current is None or rank > current[0]:
+            self.best[name] = (rank, row)
+
+    def __len__(self):
+        return len(self.best)
+
+    def __iter__(self):
+        for name in sorted(self.best):
+            yield self.best[name][1]
+
+
+def best_solutions(rows, key='pl_name'):
+    """Yield one row per planet (sorted by name) from an iterable of raw rows"""
+    merger = SolutionMerger(key)
+    for row in rows:
+        merger.add(row)
+    print(f"  🧹 Merged {merger.rows_seen} solutions into {len(merger)} planets")
+    yield from merger
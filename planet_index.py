@@ -0,0 +1,130 @@
+# planet_index.py
+"""
+In-memory secondary indexes over the exoplanet dataset
+- One sorted array per numeric field (radius, insolation, period, temperature, ...)
+- Range bounds are found with bisect in O(log n); multi-field queries start from the
+  narrowest range and check the remaining predicates only on those candidates
+- Equality indexes for categorical fields (type, habitable, discovery_method, host_star)
+- Built from the saved dataset or any list of process_planet_data dicts, so the scrapers
+  and the query server share it
+"""
+
+import json
+import math
+from bisect import bisect_left, bisect_right
+
+NUMERIC_FIELDS = [
+    'radius_earth',
+    'mass_earth',
+    'insolation_earth',
+    'orbital_period_days',
+    'equilibrium_temp_k',
+    'semi_major_axis_au',
+]
+CATEGORY_FIELDS = ['type', 'habitable', 'discovery_method', 'host_star']
+
+# Same thresholds as determine_habitability
+HABITABLE_ZONE = {'insolation_earth': (0.3, 1.7), 'radius_earth': (0.5, 2.0)}
+
+
+def numeric_value(value):
+    """Indexed value, or None for missing data (process_planet_data writes 0 for missing)"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if math.isnan(value) or value <= 0:
+        return None
+    return value
+
+
+class RangeIndex:
+    """Sorted (value, id) pairs for one numeric field"""
+
+    def __init__(self, planets, field):
+        self.field = field
+        pairs = sorted((v, i) for i, v in ((i, numeric_value(p.get(field))) for i, p in enumerate(planets))
+                       if v is not None)
+        self.values = [v for v, _ in pairs]
+        self.ids = [i for _, i in pairs]
+
+    def bounds(self, low=None, high=None):
+        start = bisect_left(self.values, low) if low is not None else 0
+        end = bisect_right(self.values, high) if high is not None else len(self.values)
+        return start, max(start, end)
+
+    def count(self, low=None, high=None):
+        start, end = self.bounds(low, high)
+        return end - start
+
+    def range(self, low=None, high=None):
+        """Ids with low <= value <= high, in ascending value order"""
+        start, end = self.bounds(low, high)
+        return self.ids[start:end]
+
+
+class PlanetIndex:
+    """Range and equality indexes over a list of planet dicts"""
+
+    def __init__(self, planets):
+        self.planets = planets
+        self.ranges = {field: RangeIndex(planets, field) for field in NUMERIC_FIELDS}
+        self.categories = {}
+        for field in CATEGORY_FIELDS:
+            groups = {}
+            for i, planet in enumerate(planets):
+                groups.setdefault(str(planet.get(field)).lower(), set()).add(i)
+            self.categories[field] = groups
+
+    @classmethod
+    def from_file(cls, filename='all_exoplanets.json'):
+        with open(filename, encoding='utf-8') as f:
+            return cls(json.load(f).get('exoplanets', []))
+
+    def ids(self, ranges=None, equals=None):
+        """Ids matching every predicate, or None when no predicate was given.
+
+        ranges: {field: (low, high)} with inclusive bounds, None for open ends
+        equals: {field: value} for categorical fields (case-insensitive)
+        """
+        ranges = {f: b for f, b in (ranges or {}).items() if b != (None, None)}
+        equals = {f: v for f, v in (equals or {}).items() if v is not None}
+        for field in ranges:
+            if field not in self.ranges:
+                raise KeyError(f"no range index on {field!r}; indexed fields: {NUMERIC_FIELDS}")
+        for field in equals:
+            if field not in self.categories:
+                raise KeyError(f"no equality index on {field!r}; indexed fields: {CATEGORY_FIELDS}")
+        if not ranges and not equals:
+            return None
+
+        # Start from the narrowest predicate: each range costs O(log n) to size up
+        candidates = [(self.ranges[f].count(*b), 'range', f) for f, b in ranges.items()]
+        candidates += [(len(self.categories[f].get(str(v).lower(), ())), 'equals', f) for f, v in equals.items()]
+        _, kind, first = min(candidates)
+        if kind == 'range':
+            result = self.ranges[first].range(*ranges[first])
+        else:
+            result = self.categories[first].get(str(equals[first]).lower(), set())
+
+        checks = [(f, b) for f, b in ranges.items() if not (kind == 'range' and f == first)]
+        sets = [self.categories[f].get(str(v).lower(), set()) for f, v in equals.items()
+                if not (kind == 'equals' and f == first)]
+        matched = set()
+        for i in result:
+            if all(i in s for s in sets) and all(self._within(i, f, low, high) for f, (low, high) in checks):
+                matched.add(i)
+        return matched
+
+    def _within(self, i, field, low, high):
+        value = numeric_value(self.planets[i].get(field))
+        return value is not None and (low is None or value >= low) and (high is None or value <= high)
+
+    def query(self, ranges=None, equals=None):
+        """Planets matching every predicate, in dataset order"""
+        ids = self.ids(ranges, equals)
+        if ids is None:
+            return list(self.planets)
+        return [self.planets[i] for i in sorted(ids)]
+
+    def habitable_zone(self):
+        """Planets the determine_habitability rule would mark habitable"""
+        return self.query(ranges=HABITABLE_ZONE)
@@ -0,0 +1,81 @@
+# planet_records.py
+"""
+Compact in-memory representation of processed planets
+- PlanetRecord stores the process_planet_data fields in __slots__ instead of a
+  per-planet dict (no per-instance hash table)
+- Categorical strings (type, habitable, discovery_method, host_star) are interned, so
+  thousands of planets share one 'Terrestrial' or 'Kepler-90' object
+- Records are read-only Mappings: planet['name'], planet.get(...) and {**planet} work
+  wherever a planet dict did (PlanetIndex, SimilarityEngine, the query server)
+- to_dict() / record_to_json give the exact dict the JSON files contain
+"""
+
+import sys
+from collections.abc import Mapping
+
+from columnar_export import SCHEMA
+
+FIELDS = tuple(key for key, _ in SCHEMA)
+FIELD_SET = frozenset(FIELDS)
+CATEGORICAL_FIELDS = frozenset(('type', 'habitable', 'discovery_method', 'host_star'))
+
+
+class PlanetRecord(Mapping):
+    """One planet; fields a source did not provide are simply absent, as in the dict"""
+
+    __slots__ = FIELDS
+
+    @classmethod
+    def from_dict(cls, planet):
+        record = cls.__new__(cls)
+        for field, value in planet.items():
+            if field in CATEGORICAL_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(record, field, value)
+        return record
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, field):
+        if field not in FIELD_SET:
+            raise KeyError(field)
+        try:
+            return object.__getattribute__(self, field)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def __iter__(self):
+        for field in FIELDS:
+            if hasattr(self, field):
+                yield field
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"PlanetRecord({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return (PlanetRecord.from_dict, (self.to_dict(),))
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self}
+
+
+def compact(planet):
+    """PlanetRecord for a planet dict with only the standard fields, else the dict itself"""
+    if isinstance(planet, PlanetRecord) or not FIELD_SET.issuperset(planet):
+        return planet
+    return PlanetRecord.from_dict(planet)
+
+
+def compact_all(planets):
+    return [compact(planet) for planet in planets]
+
+
+def record_to_json(value):
+    """json.dump(default=...) hook so lists of records serialize like lists of dicts"""
+    if isinstance(value, PlanetRecord):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
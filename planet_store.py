@@ -0,0 +1,260 @@
+# planet_store.py
+"""
+Optional SQLite backend for the exoplanet database (exoplanets.db)
+- One row per planet keyed by name, with the same fields process_planet_data emits
+- WAL journal, so readers (query server, exports) never block a running sync
+- Indexes on host_star, type, habitable and the numeric fields the UI filters on
+- Full-text search over descriptions (FTS5, kept in sync by triggers) when SQLite has it
+- Bulk executemany upserts: an incremental sync touches only the changed rows
+- all_exoplanets.json is generated from the store rather than rewritten by hand
+"""
+
+import argparse
+import json
+import sqlite3
+from datetime import datetime
+
+from atomic_io import write_json
+from columnar_export import SCHEMA
+from planet_index import NUMERIC_FIELDS
+
+DB_FILE = 'exoplanets.db'
+FIELDS = [key for key, _ in SCHEMA]
+TEXT_FIELDS = {key for key, kind in SCHEMA if kind != 'float64'}
+INDEXED_FIELDS = ['host_star', 'type', 'habitable'] + NUMERIC_FIELDS
+BATCH_SIZE = 1000
+
+
+def column_definition(field):
+    if field == 'name':
+        return 'name TEXT PRIMARY KEY'
+    # Numeric columns are left untyped so values round-trip exactly (0 stays 0, 2.0 stays 2.0)
+    return f"{field} TEXT" if field in TEXT_FIELDS else field
+
+
+def fts_available(conn):
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+class PlanetStore:
+    """SQLite-backed planet table with indexed lookups and bulk upserts"""
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.fts = fts_available(self.conn)
+        self.create_schema()
+
+    def create_schema(self):
+        columns = ', '.join(column_definition(field) for field in FIELDS)
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS planets ({columns}, updated_at TEXT)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)")
+            for field in INDEXED_FIELDS:
+                # Categorical lookups are case-insensitive, so their indexes must be too
+                collation = '' if field in NUMERIC_FIELDS else ' COLLATE NOCASE'
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_planets_{field} ON planets ({field}{collation})")
+            if self.fts:
+                self.conn.executescript("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS planets_fts
+                        USING fts5(name, description, content='planets', content_rowid='rowid');
+                    CREATE TRIGGER IF NOT EXISTS planets_fts_insert AFTER INSERT ON planets BEGIN
+                        INSERT INTO planets_fts(rowid, name, description) VALUES (new.rowid, new.name, new.description);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS planets_fts_delete AFTER DELETE ON planets BEGIN
+                        INSERT INTO planets_fts(planets_fts, rowid, name, description)
+                            VALUES ('delete', old.rowid, old.name, old.description);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS planets_fts_update AFTER UPDATE ON planets BEGIN
+                        INSERT INTO planets_fts(planets_fts, rowid, name, description)
+                            VALUES ('delete', old.rowid, old.name, old.description);
+                        INSERT INTO planets_fts(rowid, name, description) VALUES (new.rowid, new.name, new.description);
+                    END;
+                """)
+
+    def close(self):
+        self.conn.close()
+
+    def _upsert_sql(self):
+        columns = FIELDS + ['updated_at']
+        updates = ', '.join(f"{c} = excluded.{c}" for c in columns if c != 'name')
+        return (f"INSERT INTO planets ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                f"ON CONFLICT(name) DO UPDATE SET {updates}")
+
+    def _write_batches(self, planets, batch_size):
+        sql = self._upsert_sql()
+        now = datetime.now().isoformat()
+        batch = []
+        for planet in planets:
+            batch.append([planet.get(field) for field in FIELDS] + [now])
+            if len(batch) >= batch_size:
+                self.conn.executemany(sql, batch)
+                batch = []
+            yield planet
+        if batch:
+            self.conn.executemany(sql, batch)
+
+    def upsert(self, planets, batch_size=BATCH_SIZE):
+        """Insert or update planets by name in one transaction; returns how many were written"""
+        with self.conn:
+            return sum(1 for _ in self._write_batches(planets, batch_size))
+
+    def replace_stream(self, planets, batch_size=BATCH_SIZE):
+        """Pass planets through while they replace the whole table in one transaction.
+
+        Readers keep seeing the previous contents until the stream is exhausted and
+        the transaction commits; an error or an abandoned stream rolls back. So does
+        an empty stream: sources swallow fetch errors, and an outage must not wipe
+        the table.
+        """
+        self.conn.execute("BEGIN")
+        written = 0
+        try:
+            self.conn.execute("DELETE FROM planets")
+            for planet in self._write_batches(planets, batch_size):
+                written += 1
+                yield planet
+        except BaseException:
+            self.conn.rollback()
+            raise
+        if not written:
+            self.conn.rollback()
+            print(f"⚠️  No planets received; keeping the existing {self.count()} in {self.path}")
+            return
+        self.conn.commit()
+
+    def delete(self, names):
+        with self.conn:
+            self.conn.executemany("DELETE FROM planets WHERE name = ?", [(name,) for name in names])
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM planets").fetchone()[0]
+
+    def row_to_planet(self, row):
+        # Planets stored without a description (--no-descriptions) come back without one
+        return {field: row[field] for field in FIELDS if field != 'description' or row[field] is not None}
+
+    def get(self, name):
+        row = self.conn.execute("SELECT * FROM planets WHERE name = ?", (name,)).fetchone()
+        return self.row_to_planet(row) if row else None
+
+    def iter_planets(self):
+        """Every planet, sorted by name like the JSON export"""
+        for row in self.conn.execute("SELECT * FROM planets ORDER BY name"):
+            yield self.row_to_planet(row)
+
+    def find(self, ranges=None, equals=None, order_by='name', descending=False, limit=None, offset=0):
+        """Planets matching every predicate, served from the indexes.
+
+        ranges: {field: (low, high)} inclusive, None for open ends (same as PlanetIndex.ids)
+        equals: {field: value} for categorical fields (case-insensitive)
+        """
+        clauses, params = [], []
+        for field, (low, high) in (ranges or {}).items():
+            if field not in NUMERIC_FIELDS:
+                raise KeyError(f"no range index on {field!r}; indexed fields: {NUMERIC_FIELDS}")
+            # A missing value (NULL, or the JSON's 0 placeholder) never falls in a range
+            clauses.append(f"{field} > 0")
+            if low is not None:
+                clauses.append(f"{field} >= ?")
+                params.append(low)
+            if high is not None:
+                clauses.append(f"{field} <= ?")
+                params.append(high)
+        for field, value in (equals or {}).items():
+            if field not in INDEXED_FIELDS or field in NUMERIC_FIELDS:
+                raise KeyError(f"no equality index on {field!r}")
+            clauses.append(f"{field} = ? COLLATE NOCASE")
+            params.append(str(value))
+        if order_by not in FIELDS:
+            raise KeyError(f"cannot sort by {order_by!r}")
+
+        sql = "SELECT * FROM planets"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}, name"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        return [self.row_to_planet(row) for row in self.conn.execute(sql, params)]
+
+    def search(self, text, limit=20):
+        """Planets whose name or description matches `text`, best matches first.
+
+        Stores written with --no-descriptions hold no descriptions, so only names match.
+        """
+        if self.fts:
+            # Quote each word so user input can't inject FTS query syntax
+            query = ' '.join('"' + word.replace('"', '""') + '"' for word in text.split())
+            rows = self.conn.execute(
+                "SELECT planets.* FROM planets_fts JOIN planets ON planets.rowid = planets_fts.rowid "
+                "WHERE planets_fts MATCH ? ORDER BY rank LIMIT ?", (query, limit))
+        else:
+            pattern = f"%{text}%"
+            rows = self.conn.execute(
+                "SELECT * FROM planets WHERE name LIKE ? OR description LIKE ? ORDER BY name LIMIT ?",
+                (pattern, pattern, limit))
+        return [self.row_to_planet(row) for row in rows]
+
+    def set_metadata(self, metadata):
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                                  [(key, json.dumps(value)) for key, value in metadata.items()])
+
+    def metadata(self):
+        return {key: json.loads(value) for key, value in self.conn.execute("SELECT key, value FROM metadata")}
+
+    def import_json(self, filename='all_exoplanets.json'):
+        """Load a saved dataset (e.g. from an earlier JSON-only run) into the store"""
+        with open(filename, encoding='utf-8') as f:
+            data = json.load(f)
+        count = self.upsert(data.get('exoplanets', []))
+        self.set_metadata(data.get('metadata', {}))
+        print(f"🗄️  Imported {count} exoplanets from {filename} into {self.path}")
+        return count
+
+    def export_json(self, filename='all_exoplanets.json'):
+        """Write the store in the all_exoplanets.json layout the app reads"""
+        planets = list(self.iter_planets())
+        metadata = {**self.metadata(), 'total_exoplanets': len(planets)}
+        write_json(filename, {'metadata': metadata, 'exoplanets': planets}, indent=2, ensure_ascii=False)
+        print(f"💾 Exported {len(planets)} exoplanets from {self.path} to {filename}")
+        return filename
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Manage the SQLite exoplanet store')
+    parser.add_argument('--db', default=DB_FILE)
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('import', help='load a JSON dataset into the store').add_argument(
+        'json_file', nargs='?', default='all_exoplanets.json')
+    commands.add_parser('export', help='write all_exoplanets.json from the store').add_argument(
+        'json_file', nargs='?', default='all_exoplanets.json')
+    commands.add_parser('search', help='full-text search over names and descriptions').add_argument('text')
+    args = parser.parse_args(argv)
+
+    store = PlanetStore(args.db)
+    try:
+        if args.command == 'import':
+            store.import_json(args.json_file)
+        elif args.command == 'export':
+            store.export_json(args.json_file)
+        else:
+            for planet in store.search(args.text):
+                # Stores written with --no-descriptions have names only
+                description = planet.get('description')
+                print(f"{planet['name']}: {description}" if description else planet['name'])
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
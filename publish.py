@@ -0,0 +1,144 @@
+# publish.py
+"""
+Publish stage for the React app's public/ directory
+- Minifies JSON artifacts (no indent) before publishing
+- Writes content-hashed copies (e.g. all_exoplanets.3f2a9c1b7d4e.json) that are safe to cache forever
+- Writes pre-compressed .gz and .br (when brotli is installed) variants next to each copy
+- Records every artifact in data-manifest.json, which the app reads first
+- Keeps the plain filename too so older clients keep working
+- Every file is written to a temporary name and renamed into place, and the manifest is
+  written once after all artifacts, so the app never sees a half-written or mixed set
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from atomic_io import write_bytes
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_NAME = 'data-manifest.json'
+HASH_LENGTH = 12
+
+
+def minify_json(path):
+    """Return the compact UTF-8 encoding of a JSON file"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def hashed_name(logical_name, content):
+    stem, ext = os.path.splitext(logical_name)
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    return f"{stem}.{digest}{ext}", digest
+
+
+def write_compressed_variants(path, content):
+    """Write path.gz (and path.br); returns {encoding: size}"""
+    sizes = {}
+    # mtime=0 keeps the gzip bytes identical for identical content
+    gz = gzip.compress(content, compresslevel=9, mtime=0)
+    write_bytes(path + '.gz', gz)
+    sizes['gzip'] = len(gz)
+    if brotli is not None:
+        br = brotli.compress(content, quality=11)
+        write_bytes(path + '.br', br)
+        sizes['br'] = len(br)
+    return sizes
+
+
+def load_manifest(public_dir):
+    try:
+        with open(os.path.join(public_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'files': {}}
+
+
+def write_manifest(public_dir, manifest):
+    manifest['generated'] = datetime.now().isoformat()
+    content = json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+    write_bytes(os.path.join(public_dir, MANIFEST_NAME), content)
+
+
+def prune_old_versions(public_dir, logical_name, keep):
+    """Delete hashed copies of logical_name beyond the `keep` most recent"""
+    stem, ext = os.path.splitext(logical_name)
+    pattern = os.path.join(public_dir, f"{glob.escape(stem)}.{'[0-9a-f]' * HASH_LENGTH}{ext}")
+    versions = sorted(glob.glob(pattern), key=os.path.getmtime, reverse=True)
+    for old in versions[keep:]:
+        for path in (old, old + '.gz', old + '.br'):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def publish_file(source, public_dir, logical_name=None, keep=2, manifest=None):
+    """Publish one artifact into public_dir and record it in the manifest.
+
+    JSON files are minified; anything else is published byte for byte.
+    When a `manifest` dict is passed the entry is only added to it, and the caller
+    writes the manifest and prunes old versions. Returns the manifest entry.
+    """
+    logical_name = logical_name or os.path.basename(source)
+    if logical_name.endswith('.json'):
+        content = minify_json(source)
+    else:
+        with open(source, 'rb') as f:
+            content = f.read()
+
+    filename, digest = hashed_name(logical_name, content)
+    hashed_path = os.path.join(public_dir, filename)
+    if os.path.exists(hashed_path):
+        # Same content as an earlier run; mark it current so pruning keeps it
+        os.utime(hashed_path)
+    else:
+        write_bytes(hashed_path, content)
+    sizes = write_compressed_variants(hashed_path, content)
+    # Plain name for clients that do not read the manifest yet
+    write_bytes(os.path.join(public_dir, logical_name), content)
+
+    entry = {'path': f"/{filename}", 'hash': digest, 'bytes': len(content), **{f"{k}_bytes": v for k, v in sizes.items()}}
+    if manifest is None:
+        manifest = load_manifest(public_dir)
+        manifest.setdefault('files', {})[logical_name] = entry
+        write_manifest(public_dir, manifest)
+        prune_old_versions(public_dir, logical_name, keep)
+    else:
+        manifest.setdefault('files', {})[logical_name] = entry
+
+    print(f"📦 Published {logical_name} -> {filename} ({len(content)} bytes, gzip {sizes['gzip']})")
+    return entry
+
+
+def publish_files(sources, public_dir=None, pages_from=None):
+    """Publish several artifacts; defaults to the repo's public/ directory.
+
+    With `pages_from` (a saved dataset) the paged list-view export is written too and
+    goes live in the same manifest write as the files.
+    """
+    public_dir = public_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'public')
+    if not os.path.isdir(public_dir):
+        print(f"⚠️ Public directory not found: {public_dir}")
+        return {}
+    manifest = load_manifest(public_dir)
+    entries = {os.path.basename(source): publish_file(source, public_dir, manifest=manifest) for source in sources}
+    if pages_from:
+        # Imported here: paged_export uses this module's manifest helpers
+        from paged_export import INDEX_NAME, export_pages_from_file, prune_old_exports
+        entries[INDEX_NAME] = export_pages_from_file(pages_from, public_dir, manifest=manifest)
+    # Switch the app to the new set in one step, then drop versions it no longer needs
+    write_manifest(public_dir, manifest)
+    for logical_name, entry in entries.items():
+        if pages_from and logical_name == INDEX_NAME:
+            prune_old_exports(os.path.join(public_dir, 'planets'), entry['hash'], keep=2)
+        else:
+            prune_old_versions(public_dir, logical_name, keep=2)
+    return entries
@@ -0,0 +1,212 @@
+# query_server.py
+"""
+Local query server for the exoplanet dataset
+- Loads the output of save_data (all_exoplanets.json) once into indexed in-memory structures
+- Serves /planets?type=&habitable=&min_radius=&max_radius=&sort=&order=&page=&page_size=
+  (plus min_/max_ for every field indexed by planet_index, e.g. min_insolation)
+- Serves /similar?name=&k= nearest-neighbour lookups from the similarity KD-tree
+- Filtering, sorting and pagination happen server-side; repeated queries hit a response cache
+- HTTP/1.1 keep-alive, ETags and 304 Not Modified; CORS enabled for the React dev server
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import sys
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from urllib.parse import parse_qs, urlparse
+
+from planet_index import CATEGORY_FIELDS, NUMERIC_FIELDS, PlanetIndex
+from planet_records import compact_all, record_to_json
+from similarity import SimilarityEngine
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+# Short query parameter names, e.g. min_radius instead of min_radius_earth
+RANGE_ALIASES = {'radius_earth': 'radius', 'mass_earth': 'mass', 'insolation_earth': 'insolation',
+                 'orbital_period_days': 'period', 'equilibrium_temp_k': 'temp'}
+SORT_FIELDS = ['name', 'host_star', 'radius_earth', 'mass_earth', 'orbital_period_days',
+               'equilibrium_temp_k', 'insolation_earth']
+
+
+def sort_key(value):
+    """Order numbers and strings, with missing values last"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return (2, 0)
+    if isinstance(value, (int, float)):
+        return (0, value)
+    return (1, str(value).lower())
+
+
+class PlanetDataset:
+    """Immutable, indexed view over a list of planet dicts"""
+
+    def __init__(self, planets, version):
+        self.planets = planets
+        self.version = version
+        self.index = PlanetIndex(planets)
+        self.similarity = SimilarityEngine.for_dataset(planets)
+        self.orders = {field: sorted(range(len(planets)), key=lambda i: sort_key(planets[i].get(field)))
+                       for field in SORT_FIELDS}
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        planets = compact_all(json.loads(raw).get('exoplanets', []))
+        return cls(planets, hashlib.sha256(raw).hexdigest()[:16])
+
+    def query(self, ranges=None, equals=None, sort='name', descending=False,
+              page=1, page_size=DEFAULT_PAGE_SIZE):
+        """Return (total, planets on the requested page)"""
+        candidates = self.index.ids(ranges, equals)
+
+        order = self.orders.get(sort, self.orders['name'])
+        if descending:
+            order = reversed(order)
+        start = (page - 1) * page_size
+        if candidates is None:
+            total = len(self.planets)
+            selected = list(islice(order, start, start + page_size))
+        else:
+            total = len(candidates)
+            selected = []
+            seen = 0
+            for i in order:
+                if i in candidates:
+                    if seen >= start:
+                        selected.append(i)
+                        if len(selected) == page_size:
+                            break
+                    seen += 1
+        return total, [self.planets[i] for i in selected]
+
+
+def parse_float(values):
+    if not values or values[0] == '':
+        return None
+    return float(values[0])
+
+
+def make_handler(dataset):
+    @lru_cache(maxsize=1024)
+    def render(query_string):
+        """Build (status, body, etag) for a normalized query string"""
+        params = parse_qs(query_string)
+        try:
+            page = max(1, int(params.get('page', ['1'])[0]))
+            page_size = min(MAX_PAGE_SIZE, max(1, int(params.get('page_size', [str(DEFAULT_PAGE_SIZE)])[0])))
+            ranges = {}
+            for field in NUMERIC_FIELDS:
+                alias = RANGE_ALIASES.get(field, field)
+                ranges[field] = (parse_float(params.get(f'min_{alias}') or params.get(f'min_{field}')),
+                                 parse_float(params.get(f'max_{alias}') or params.get(f'max_{field}')))
+        except ValueError as e:
+            return 400, json.dumps({'error': str(e)}).encode('utf-8'), None
+
+        sort = params.get('sort', ['name'])[0]
+        if sort not in SORT_FIELDS:
+            return 400, json.dumps({'error': f"sort must be one of {SORT_FIELDS}"}).encode('utf-8'), None
+
+        total, planets = dataset.query(
+            ranges=ranges,
+            equals={field: params.get(field, [None])[0] for field in CATEGORY_FIELDS},
+            sort=sort,
+            descending=params.get('order', ['asc'])[0] == 'desc',
+            page=page,
+            page_size=page_size,
+        )
+        body = json.dumps({
+            'total': total,
+            'page': page,
+            'page_size': page_size,
+            'pages': max(1, -(-total // page_size)),
+            'planets': planets
+        }, ensure_ascii=False, separators=(',', ':'), default=record_to_json).encode('utf-8')
+        etag = '"%s-%s"' % (dataset.version, hashlib.sha256(query_string.encode('utf-8')).hexdigest()[:16])
+        return 200, body, etag
+
+    class PlanetQueryHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive
+        server_version = 'ExoplanetQuery/1.0'
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/health':
+                return self.send_json(200, json.dumps({'status': 'ok', 'version': dataset.version,
+                                                       'total': len(dataset.planets)}).encode('utf-8'))
+            if url.path.rstrip('/') == '/similar':
+                return self.send_similar(parse_qs(url.query))
+            if url.path.rstrip('/') != '/planets':
+                return self.send_json(404, b'{"error":"not found"}')
+
+            # Normalize parameter order so equivalent queries share cache entries and ETags
+            query_string = '&'.join(sorted(url.query.split('&'))) if url.query else ''
+            status, body, etag = render(query_string)
+            if etag and self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_json(status, body, etag)
+
+        def send_similar(self, params):
+            name = params.get('name', [None])[0]
+            try:
+                k = min(50, max(1, int(params.get('k', ['5'])[0])))
+            except ValueError as e:
+                return self.send_json(400, json.dumps({'error': str(e)}).encode('utf-8'))
+            results = dataset.similarity.similar_to(name, k) if name else []
+            if not results and name not in dataset.similarity.by_name:
+                return self.send_json(404, json.dumps({'error': f"unknown planet {name!r}"}).encode('utf-8'))
+            body = json.dumps({'name': name, 'k': k, 'similar': [
+                {'distance': round(distance, 4), **planet} for planet, distance in results
+            ]}, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            self.send_json(200, body)
+
+        def send_json(self, status, body, etag=None):
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Cache-Control', 'no-cache')
+            if etag:
+                self.send_header('ETag', etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return PlanetQueryHandler
+
+
+def serve(data_file='all_exoplanets.json', host='127.0.0.1', port=8000):
+    dataset = PlanetDataset.load(data_file)
+    server = ThreadingHTTPServer((host, port), make_handler(dataset))
+    server.daemon_threads = True
+    print(f"🛰️ Serving {len(dataset.planets)} exoplanets on http://{host}:{port}/planets")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the exoplanet dataset with filtering and pagination')
+    parser.add_argument('--data', default='all_exoplanets.json', help='dataset written by save_data')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args(argv)
+    serve(args.data, args.host, args.port)
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
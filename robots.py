@@ -0,0 +1,157 @@
+# robots.py
+"""
+robots.txt rules engine with a host-keyed cache
+- Parses each host's robots.txt once and compiles its rules into regular expressions
+- Honours Allow and Disallow, `*` wildcards and `$` end anchors, using the longest
+  matching rule (Allow wins ties), as major crawlers do
+- Applies the groups whose User-agent is our product token (version and case ignored,
+  groups naming it more than once merged), falling back to the `*` groups
+- Exposes Crawl-delay so the fetch scheduler can slow down per host
+- Cached per host with a TTL, so per-URL checks after the first are in memory
+"""
+
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+DEFAULT_AGENT = 'myscraper'
+ROBOTS_TTL = 24 * 3600
+
+
+def compile_pattern(path):
+    """Regex for a robots.txt path pattern (`*` matches anything, trailing `$` anchors)"""
+    anchored = path.endswith('$')
+    if anchored:
+        path = path[:-1]
+    regex = '.*'.join(re.escape(part) for part in path.split('*'))
+    return re.compile(regex + ('$' if anchored else ''))
+
+
+def product_token(agent):
+    """Product name of a user agent (`MyScraper/1.0` -> `myscraper`), compared case-insensitively"""
+    return agent.split('/', 1)[0].strip().lower()
+
+
+def parse_groups(text):
+    """[(agents, rules, crawl_delay)] where rules are (allow, pattern) pairs"""
+    groups = []
+    agents, rules, delay = [], [], None
+    in_rules = False
+    for line in text.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if ':' not in line:
+            continue
+        field, value = (part.strip() for part in line.split(':', 1))
+        field = field.lower()
+        if field == 'user-agent':
+            # A user-agent line after rules starts a new group
+            if in_rules:
+                groups.append((agents, rules, delay))
+                agents, rules, delay = [], [], None
+                in_rules = False
+            agents.append(value.lower())
+        elif field in ('allow', 'disallow'):
+            in_rules = True
+            if agents and value:
+                rules.append((field == 'allow', value))
+        elif field == 'crawl-delay':
+            in_rules = True
+            try:
+                delay = float(value)
+            except ValueError:
+                pass
+    if agents:
+        groups.append((agents, rules, delay))
+    return groups
+
+
+class RobotsRules:
+    """Compiled rules of the robots.txt group that applies to one user agent"""
+
+    def __init__(self, rules=(), crawl_delay=None):
+        # Longest pattern first so the first match is the most specific rule
+        self.rules = sorted(((len(pattern), allow, compile_pattern(pattern)) for allow, pattern in rules),
+                            key=lambda rule: (-rule[0], not rule[1]))
+        self.crawl_delay = crawl_delay
+
+    @classmethod
+    def parse(cls, text, agent=DEFAULT_AGENT):
+        """Rules for `agent`: every group naming its product token, else every `*` group"""
+        token = product_token(agent)
+        ours, fallback = [], []
+        for agents, rules, delay in parse_groups(text):
+            names = {product_token(name) for name in agents}
+            if token in names:
+                ours.append((rules, delay))
+            elif '*' in names:
+                fallback.append((rules, delay))
+        groups = ours or fallback
+        if not groups:
+            return cls()
+        delays = [delay for _, delay in groups if delay is not None]
+        return cls([rule for rules, _ in groups for rule in rules], max(delays) if delays else None)
+
+    @classmethod
+    def allow_all(cls):
+        return cls()
+
+    def allowed(self, url):
+        parsed = urlparse(url)
+        path = (parsed.path or '/') + (f"?{parsed.query}" if parsed.query else '')
+        if path == '/robots.txt':
+            return True
+        for _, allow, regex in self.rules:
+            if regex.match(path):
+                return allow
+        return True
+
+
+class RobotsCache:
+    """robots.txt rules per scheme://host, refreshed after `ttl` seconds"""
+
+    def __init__(self, agent=DEFAULT_AGENT, ttl=ROBOTS_TTL):
+        self.agent = agent
+        self.ttl = ttl
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def rules_for(self, url, session, timeout=10):
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        with self.lock:
+            entry = self.hosts.get(origin)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+
+        rules = self.fetch_rules(origin, session, timeout)
+        with self.lock:
+            self.hosts[origin] = (time.monotonic() + self.ttl, rules)
+        return rules
+
+    def fetch_rules(self, origin, session, timeout=10):
+        try:
+            r = session.get(f"{origin}/robots.txt", timeout=timeout)
+        except Exception:
+            return RobotsRules.allow_all()
+        if r.status_code != 200:
+            return RobotsRules.allow_all()
+        return RobotsRules.parse(r.text, self.agent)
+
+    def allowed(self, url, session):
+        return self.rules_for(url, session).allowed(url)
+
+    def crawl_delay(self, url, session):
+        return self.rules_for(url, session).crawl_delay
+
+    def apply_crawl_delay(self, url, session, fetcher):
+        """Slow the fetcher's token bucket for this host down to the Crawl-delay, if any"""
+        delay = self.crawl_delay(url, session)
+        if delay:
+            bucket = fetcher.bucket_for(url)
+            bucket.set_rate(min(bucket.rate, 1.0 / delay))
+        return delay
+
+
+# Shared by every allowed_by_robots call in the process
+ROBOTS_CACHE = RobotsCache()
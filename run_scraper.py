@@ -2,98 +2,199 @@
 """
 NASA Exoplanets Scraper Runner
 This script runs the NASA exoplanets scraper and prepares the data for the React app.
+Scrapers run in this process (no subprocess per scraper), so output streams live and
+requests/bs4 are imported once; each scraper keeps its own pooled session (and User-Agent).
 """
 
-import subprocess
-import sys
+import argparse
+import importlib.util
 import os
-import json
+import sys
+import time
 from pathlib import Path
 
-def run_scraper():
-    """Run the NASA exoplanets scraper"""
+from publish import publish_files
+
+SCRIPT_DIR = Path(__file__).parent
+
+# pip package name -> import name
+REQUIRED_PACKAGES = {
+    'requests': 'requests',
+    'beautifulsoup4': 'bs4',
+}
+
+
+def progress(scraper, message, started):
+    """Print a timestamped progress line immediately, even when stdout is piped"""
+    print(f"[{scraper} +{time.monotonic() - started:.1f}s] {message}", flush=True)
+
+
+def make_fetcher(name):
+    """Pooled, cached ConcurrentFetcher for one scraper, with that scraper's own User-Agent.
+
+    The scrapers talk to different hosts, so a shared pool would save nothing; each
+    fetcher is kept for the whole run (or daemon lifetime) so its connections stay warm.
+    """
+    from fetcher import ConcurrentFetcher
+    if name == 'archive':
+        from working_exoplanet_scraper import WorkingExoplanetScraper
+        return ConcurrentFetcher(user_agent=WorkingExoplanetScraper.USER_AGENT)
+    from nasa_exoplanets_scraper import make_session
+    return ConcurrentFetcher(session=make_session())
+
+
+def run_scraper(fetcher=None):
+    """Run the NASA exoplanets page scraper"""
+    from nasa_exoplanets_scraper import scrape_and_save
+    import requests
+
     print("🚀 Starting NASA Exoplanets Scraper...")
-    
-    # Get the directory where this script is located
-    script_dir = Path(__file__).parent
-    scraper_file = script_dir / "nasa_exoplanets_scraper.py"
-    
-    if not scraper_file.exists():
-        print(f"❌ Scraper file not found: {scraper_file}")
-        return False
-    
+    started = time.monotonic()
+
     try:
-        # Run the scraper
-        result = subprocess.run([
-            sys.executable, str(scraper_file)
-        ], capture_output=True, text=True, cwd=script_dir)
-        
-        if result.returncode == 0:
-            print("✅ Scraper completed successfully!")
-            print("📄 Output:", result.stdout)
-            
-            # Check if results.json was created
-            results_file = script_dir / "results.json"
-            if results_file.exists():
-                print(f"📊 Results saved to: {results_file}")
-                
-                # Copy results.json to public directory for React app
-                public_dir = script_dir / "public"
-                if public_dir.exists():
-                    import shutil
-                    shutil.copy2(results_file, public_dir / "results.json")
-                    print("📁 Results copied to public directory for React app")
-                else:
-                    print("⚠️  Public directory not found, results.json not copied")
-                
-                return True
+        progress('page', 'fetching and parsing', started)
+        data = scrape_and_save(session=fetcher.session if fetcher else None)
+        if data is None:
+            print("❌ Scraper failed!")
+            return False
+        print("✅ Scraper completed successfully!")
+
+        # Check if results.json was created
+        results_file = SCRIPT_DIR / "results.json"
+        if results_file.exists():
+            print(f"📊 Results saved to: {results_file}")
+
+            # Publish results.json to public directory for React app
+            if publish_files([str(results_file)], str(SCRIPT_DIR / "public")):
+                print("📁 Results published to public directory for React app")
             else:
-                print("❌ results.json not found after scraping")
-                return False
+                print("⚠️  Public directory not found, results.json not published")
+
+            progress('page', 'done', started)
+            return True
         else:
-            print("❌ Scraper failed!")
-            print("Error:", result.stderr)
+            print("❌ results.json not found after scraping")
             return False
-            
+
+    except requests.HTTPError as he:
+        print(f"❌ HTTP error: {he}")
+        return False
     except Exception as e:
         print(f"❌ Error running scraper: {e}")
         return False
 
-def check_dependencies():
-    """Check if required Python packages are installed"""
-    required_packages = ['requests', 'beautifulsoup4']
-    missing_packages = []
-    
-    for package in required_packages:
+
+def run_archive_scraper(fetcher=None, incremental=False):
+    """Run the NASA Exoplanet Archive sync (working_exoplanet_scraper)"""
+    import working_exoplanet_scraper
+
+    started = time.monotonic()
+    progress('archive', 'incremental sync' if incremental else 'full sync', started)
+    ok = working_exoplanet_scraper.main(incremental=incremental, fetcher=fetcher)
+    progress('archive', 'done' if ok else 'failed', started)
+    return ok
+
+
+SCRAPERS = {
+    'page': run_scraper,
+    'archive': run_archive_scraper,
+}
+
+
+def run_scrapers(names=('page',), incremental=False):
+    """Run several scrapers in this process; returns {name: ok}"""
+    results = {}
+    for name in names:
+        fetcher = make_fetcher(name)
         try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
-    
+            if name == 'archive':
+                results[name] = run_archive_scraper(fetcher, incremental=incremental)
+            else:
+                results[name] = SCRAPERS[name](fetcher)
+        finally:
+            fetcher.close()
+    return results
+
+
+def run_daemon(page_interval=60, archive_interval=24 * 60, max_runs=None):
+    """Refresh forever: page scrape and archive sync on their own intervals (minutes)"""
+    from scheduler import Job, Scheduler, archive_fingerprint, page_fingerprint
+
+    fetchers = {name: make_fetcher(name) for name in ('page', 'archive')}
+    page, archive = fetchers['page'], fetchers['archive']
+    jobs = [
+        Job('page', page_interval * 60, run=lambda: run_scraper(page),
+            probe=lambda: page_fingerprint(page.session)),
+        Job('archive', archive_interval * 60, run=lambda: run_archive_scraper(archive, incremental=True),
+            probe=lambda: archive_fingerprint(archive.session)),
+    ]
+    print(f"🛰️  Daemon started: page every {page_interval} min, archive every {archive_interval} min", flush=True)
+    try:
+        Scheduler(jobs).run(max_runs)
+    except KeyboardInterrupt:
+        print("\n👋 Daemon stopped")
+    finally:
+        for fetcher in fetchers.values():
+            fetcher.close()
+
+
+def check_dependencies():
+    """Check if required Python packages are installed (without importing them)"""
+    missing_packages = [package for package, module in REQUIRED_PACKAGES.items()
+                        if importlib.util.find_spec(module) is None]
+
     if missing_packages:
         print(f"❌ Missing required packages: {', '.join(missing_packages)}")
         print("📦 Install them with: pip install " + " ".join(missing_packages))
         return False
-    
+
     print("✅ All required packages are installed")
     return True
 
-def main():
+
+def main(argv=None):
     """Main function"""
+    parser = argparse.ArgumentParser(description='Run the exoplanet scrapers and publish their data')
+    parser.add_argument('scrapers', nargs='*', metavar='scraper',
+                        help=f"scrapers to run: {', '.join(SCRAPERS)} (default: page)")
+    parser.add_argument('--all', action='store_true', help='run every scraper')
+    parser.add_argument('--incremental', action='store_true', help='incremental archive sync')
+    parser.add_argument('--daemon', action='store_true', help='keep running and refresh periodically')
+    parser.add_argument('--page-interval', type=float, default=60, help='daemon: minutes between page scrapes')
+    parser.add_argument('--archive-interval', type=float, default=24 * 60,
+                        help='daemon: minutes between archive syncs')
+    args = parser.parse_args(argv)
+    # Scraper output is plain print(); keep it live when stdout is a pipe (cron, log files)
+    sys.stdout.reconfigure(line_buffering=True)
+    names = list(SCRAPERS) if args.all else args.scrapers or ['page']
+    unknown = [name for name in names if name not in SCRAPERS]
+    if unknown:
+        parser.error(f"unknown scraper(s): {', '.join(unknown)}")
+
     print("🌌 NASA Exoplanets Scraper Integration")
     print("=" * 50)
-    
+
     # Check dependencies
     if not check_dependencies():
         return
-    
-    # Run the scraper
-    if run_scraper():
+
+    # Outputs are written next to this script, as the scrapers expect
+    os.chdir(SCRIPT_DIR)
+
+    if args.daemon:
+        run_daemon(args.page_interval, args.archive_interval)
+        return
+
+    # Run the scrapers
+    results = run_scrapers(names, incremental=args.incremental)
+    if all(results.values()):
         print("\n🎉 Scraping completed successfully!")
         print("🔄 You can now refresh your React app to see the scraped data")
         print("📝 The app will automatically use scraped data if available, or fallback to static data")
     else:
-        print("\n❌ Scraping failed. The React app will use fallback data.")
+        failed = ', '.join(name for name, ok in results.items() if not ok)
+        print(f"\n❌ Scraping failed ({failed}). The React app will use fallback data.")
+
 
 if __name__ == "__main__":
     main()
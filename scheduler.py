@@ -0,0 +1,125 @@
+# scheduler.py
+"""
+Long-running refresh daemon for the scrapers
+- Keeps each job's ConcurrentFetcher alive between runs, so the connection pool, the on-disk
+  HTTP cache and the robots.txt cache stay warm
+- Each job (NASA page scrape, archive sync) runs on its own interval, with random
+  jitter so runs don't line up
+- Before a run each job probes its source cheaply and skips the run when the source
+  fingerprint has not changed since the last successful run
+- rowupdate only has day precision, so the archive fingerprint also counts the rows
+  updated on the latest day and changes once that day is over, which forces one run
+  after the day rolls over to catch same-day edits no aggregate can see
+- Publishing goes through publish_files, which swaps public/ files atomically and
+  writes the manifest last
+"""
+
+import hashlib
+import heapq
+import random
+import time
+from datetime import date
+
+from nasa_exoplanets_scraper import BASE_URL
+from tap_stream import stream_tap_rows, tap_url
+
+ARCHIVE_PROBE_QUERY = "select count(pl_name) as planets, max(rowupdate) as latest from pscomppars"
+# Rows updated on the latest rowupdate day: catches another row changing later that day
+ARCHIVE_LATEST_DAY_QUERY = ("select count(pl_name) as updated from pscomppars "
+                            "where rowupdate >= to_date('{day}','yyyy-mm-dd')")
+# Probes must ask the server even when the HTTP cache holds a fresh copy; the
+# revalidation still makes an unchanged page cost only a 304
+REVALIDATE = {'Cache-Control': 'no-cache'}
+
+
+def page_fingerprint(session, url=BASE_URL):
+    """ETag (or body hash) of the NASA page, always confirmed with the server"""
+    r = session.get(url, timeout=15, headers=REVALIDATE)
+    r.raise_for_status()
+    return r.headers.get('ETag') or hashlib.sha256(r.content).hexdigest()
+
+
+def archive_fingerprint(session, today=None):
+    """Planet count, latest rowupdate, rows updated that day and whether that day is over.
+
+    Two one-row TAP queries. The last part flips once `today` (default: the local date)
+    is past the latest rowupdate day, so a row edited again later on the day of a run is
+    picked up by the first run after midnight.
+    """
+    rows = list(stream_tap_rows(session, tap_url(ARCHIVE_PROBE_QUERY), headers=REVALIDATE))
+    if not rows:
+        return None
+    planets, latest = rows[0].get('planets'), rows[0].get('latest')
+    if not latest:
+        return f"{planets}|{latest}"
+    day = str(latest)[:10]
+    rows = list(stream_tap_rows(session, tap_url(ARCHIVE_LATEST_DAY_QUERY.format(day=day)), headers=REVALIDATE))
+    updated = rows[0].get('updated') if rows else None
+    settled = (today or date.today()).isoformat() > day
+    return f"{planets}|{latest}|{updated}|{'settled' if settled else 'open'}"
+
+
+class Job:
+    """A periodic task: probe() returns a source fingerprint, run() refreshes the data"""
+
+    def __init__(self, name, interval, run, probe=None, jitter=0.1):
+        self.name = name
+        self.interval = interval
+        self.run = run
+        self.probe = probe
+        self.jitter = jitter
+        self.fingerprint = None
+
+    def next_delay(self):
+        return self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def __call__(self):
+        """Run the job unless its source is unchanged; returns 'skipped', 'ok' or 'failed'"""
+        fingerprint = None
+        if self.probe is not None:
+            try:
+                fingerprint = self.probe()
+            except Exception as e:
+                # Can't tell whether anything changed, so refresh anyway
+                print(f"⚠️  [{self.name}] probe failed: {e}")
+            if fingerprint is not None and fingerprint == self.fingerprint:
+                return 'skipped'
+
+        try:
+            ok = self.run()
+        except Exception as e:
+            print(f"❌ [{self.name}] {e}")
+            ok = False
+        if ok and fingerprint is not None:
+            self.fingerprint = fingerprint
+        return 'ok' if ok else 'failed'
+
+
+class Scheduler:
+    """Run jobs forever (or for max_runs job executions), earliest due first"""
+
+    def __init__(self, jobs, clock=time.monotonic, sleep=time.sleep):
+        self.jobs = jobs
+        self.clock = clock
+        self.sleep = sleep
+
+    def run(self, max_runs=None):
+        now = self.clock()
+        # Every job runs once at start-up, in the given order
+        queue = [(now, i, job) for i, job in enumerate(self.jobs)]
+        heapq.heapify(queue)
+        runs = 0
+        while queue and (max_runs is None or runs < max_runs):
+            due, i, job = heapq.heappop(queue)
+            wait = due - self.clock()
+            if wait > 0:
+                self.sleep(wait)
+
+            started = self.clock()
+            outcome = job()
+            runs += 1
+            delay = job.next_delay()
+            print(f"⏱️  [{job.name}] {outcome} in {self.clock() - started:.1f}s, next run in {delay / 60:.0f} min",
+                  flush=True)
+            heapq.heappush(queue, (self.clock() + delay, i, job))
+        return runs
@@ -0,0 +1,175 @@
+# similarity.py
+"""
+"Similar planets" search over the fields process_planet_data emits
+- Features: radius, mass, orbital period, equilibrium temperature, insolation
+- Skewed features are log-scaled, then every feature is z-score normalized;
+  missing values (0/None) sit at the feature mean so they neither attract nor repel
+- Builds a KD-tree once per dataset version (scipy's cKDTree when installed,
+  otherwise a small pure-Python tree) and answers k-NN queries from it
+- Can precompute the top-k neighbours of every planet for the static export
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+
+from atomic_io import atomic_write
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# (field, log-scale?)
+FEATURES = [
+    ('radius_earth', True),
+    ('mass_earth', True),
+    ('orbital_period_days', True),
+    ('equilibrium_temp_k', False),
+    ('insolation_earth', True),
+]
+# Planets with fewer known features than this are not worth comparing
+MIN_KNOWN_FEATURES = 2
+
+
+def raw_feature(planet, field, log_scale):
+    value = planet.get(field)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not value > 0:
+        return None
+    return math.log10(value) if log_scale else float(value)
+
+
+class KDTree:
+    """Minimal static KD-tree with k-nearest-neighbour search"""
+
+    def __init__(self, points):
+        self.points = points
+        self.dimensions = len(points[0]) if points else 0
+        self.root = self._build(list(range(len(points))), 0)
+
+    def _build(self, ids, depth):
+        if not ids:
+            return None
+        axis = depth % self.dimensions
+        ids.sort(key=lambda i: self.points[i][axis])
+        middle = len(ids) // 2
+        return (ids[middle], axis,
+                self._build(ids[:middle], depth + 1),
+                self._build(ids[middle + 1:], depth + 1))
+
+    def query(self, point, k):
+        """Return [(distance, id)] for the k points closest to `point`, nearest first"""
+        heap = []  # max-heap of (-squared distance, id)
+
+        def visit(node):
+            if node is None:
+                return
+            index, axis, left, right = node
+            squared = sum((a - b) ** 2 for a, b in zip(point, self.points[index]))
+            if len(heap) < k:
+                heapq.heappush(heap, (-squared, index))
+            elif squared < -heap[0][0]:
+                heapq.heapreplace(heap, (-squared, index))
+            delta = point[axis] - self.points[index][axis]
+            near, far = (left, right) if delta < 0 else (right, left)
+            visit(near)
+            if len(heap) < k or delta * delta < -heap[0][0]:
+                visit(far)
+
+        visit(self.root)
+        return [(math.sqrt(-d), i) for d, i in sorted(heap, reverse=True)]
+
+
+class SimilarityEngine:
+    """Normalized feature space plus a KD-tree for one dataset version"""
+
+    _cache = {}
+
+    def __init__(self, planets):
+        self.planets = planets
+        raw = [[raw_feature(p, field, log) for field, log in FEATURES] for p in planets]
+
+        self.means = []
+        self.scales = []
+        for column in zip(*raw) if raw else []:
+            known = [v for v in column if v is not None]
+            mean = sum(known) / len(known) if known else 0.0
+            variance = sum((v - mean) ** 2 for v in known) / len(known) if known else 0.0
+            self.means.append(mean)
+            self.scales.append(math.sqrt(variance) or 1.0)
+
+        # Only planets with enough known features take part
+        self.ids = [i for i, row in enumerate(raw)
+                    if sum(v is not None for v in row) >= MIN_KNOWN_FEATURES]
+        self.position = {planet_id: n for n, planet_id in enumerate(self.ids)}
+        self.vectors = [self.normalize(raw[i]) for i in self.ids]
+        self.by_name = {planets[i].get('name'): i for i in self.ids}
+
+        if not self.vectors:
+            self.tree = None
+        elif cKDTree is not None:
+            self.tree = cKDTree(self.vectors)
+        else:
+            self.tree = KDTree(self.vectors)
+
+    @classmethod
+    def for_dataset(cls, planets):
+        """Reuse the engine built for an identical dataset"""
+        version = hashlib.sha256(json.dumps(
+            [[p.get('name')] + [p.get(f) for f, _ in FEATURES] for p in planets],
+            default=str).encode('utf-8')).hexdigest()
+        if version not in cls._cache:
+            cls._cache.clear()
+            cls._cache[version] = cls(planets)
+        return cls._cache[version]
+
+    def normalize(self, row):
+        return [0.0 if v is None else (v - m) / s for v, m, s in zip(row, self.means, self.scales)]
+
+    def _nearest(self, vector, k):
+        if self.tree is None:
+            return []
+        k = min(k, len(self.vectors))
+        if cKDTree is not None and isinstance(self.tree, cKDTree):
+            distances, positions = self.tree.query(vector, k=k)
+            if k == 1:
+                distances, positions = [distances], [positions]
+            return list(zip(map(float, distances), map(int, positions)))
+        return self.tree.query(vector, k)
+
+    def similar_to(self, name, k=5):
+        """[(planet, distance)] for the k planets most similar to `name` (excluding itself)"""
+        planet_id = self.by_name.get(name)
+        if planet_id is None:
+            return []
+        vector = self.vectors[self.position[planet_id]]
+        results = []
+        for distance, position in self._nearest(vector, k + 1):
+            neighbour = self.ids[position]
+            if neighbour != planet_id:
+                results.append((self.planets[neighbour], distance))
+        return results[:k]
+
+    def similar_to_values(self, values, k=5):
+        """k nearest planets to an arbitrary {field: value} dict"""
+        vector = self.normalize([raw_feature(values, field, log) for field, log in FEATURES])
+        return [(self.planets[self.ids[position]], distance) for distance, position in self._nearest(vector, k)]
+
+    def precompute(self, k=5):
+        """{planet name: [names of its k most similar planets]} for every indexed planet"""
+        return {self.planets[i].get('name'): [p.get('name') for p, _ in self.similar_to(self.planets[i].get('name'), k)]
+                for i in self.ids}
+
+
+def export_similar_planets(json_file='all_exoplanets.json', out_file='similar_planets.json', k=5):
+    """Write the precomputed neighbour table next to a saved dataset"""
+    with open(json_file, encoding='utf-8') as f:
+        planets = json.load(f).get('exoplanets', [])
+    neighbours = SimilarityEngine.for_dataset(planets).precompute(k)
+    with atomic_write(out_file) as f:
+        json.dump({'k': k, 'features': [field for field, _ in FEATURES], 'similar': neighbours},
+                  f, ensure_ascii=False, separators=(',', ':'))
+    print(f"🔭 Precomputed {k} similar planets for {len(neighbours)} exoplanets ({os.path.getsize(out_file)} bytes)")
+    return out_file
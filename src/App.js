@@ -1,10 +1,12 @@
 import React, { useState, useEffect } from 'react';
 import Orb from './Orb';
 import GradientText from './GradientText';
+import { describePlanet } from './planetDescription';
 import './App.css';
 
 function App() {
   const [exoplanets, setExoplanets] = useState([]);
+  const [totalExoplanets, setTotalExoplanets] = useState(0);
   const [loading, setLoading] = useState(true);
   const [searchTerm, setSearchTerm] = useState('');
   const [activePage, setActivePage] = useState('home');
@@ -35,8 +37,16 @@ function App() {
 
   const fetchExoplanets = async () => {
     try {
-      const data = await getExoplanetData();
-      setExoplanets(data);
+      // The list view only shows one page, so load just that when pages are published
+      const firstPage = await getFirstPage();
+      if (firstPage) {
+        setExoplanets(firstPage.planets);
+        setTotalExoplanets(firstPage.total);
+      } else {
+        const data = await getExoplanetData();
+        setExoplanets(data);
+        setTotalExoplanets(data.length);
+      }
       setLoading(false);
     } catch (error) {
       console.error('Error fetching exoplanet data:', error);
@@ -44,10 +54,43 @@ function App() {
     }
   };
 
+  // Resolve a data file to its content-hashed copy via the publish manifest
+  const resolveDataUrl = async (name) => {
+    try {
+      const response = await fetch('/data-manifest.json', { cache: 'no-cache' });
+      if (response.ok) {
+        const manifest = await response.json();
+        const entry = manifest.files && manifest.files[name];
+        if (entry && entry.path) return entry.path;
+      }
+    } catch (error) {
+      console.log('No data manifest found, using plain file names');
+    }
+    return `/${name}`;
+  };
+
+  const getFirstPage = async (collection = 'all') => {
+    try {
+      const response = await fetch(await resolveDataUrl('planets/index.json'));
+      if (!response.ok) return null;
+      const index = await response.json();
+      const entry = index.collections && index.collections[collection];
+      if (!entry || !entry.files.length) return null;
+      const pageResponse = await fetch(`${index.base}${entry.files[0]}`);
+      if (!pageResponse.ok) return null;
+      const page = await pageResponse.json();
+      console.log(`📄 Loaded page 1 of ${page.pages} (${page.total} exoplanets)`);
+      return page;
+    } catch (error) {
+      console.log('No paged data found, loading full database...');
+      return null;
+    }
+  };
+
   const getExoplanetData = async () => {
     try {
       // Try to fetch from comprehensive exoplanet database first
-      const response = await fetch('/all_exoplanets.json');
+      const response = await fetch(await resolveDataUrl('all_exoplanets.json'));
       if (response.ok) {
         const data = await response.json();
         console.log(`📊 Loaded ${data.exoplanets.length} exoplanets from comprehensive database`);
@@ -59,7 +102,7 @@ function App() {
     
     try {
       // Try to fetch from Python scraper results
-      const response = await fetch('/results.json');
+      const response = await fetch(await resolveDataUrl('results.json'));
       if (response.ok) {
         const scrapedData = await response.json();
         return processScrapedData(scrapedData);
@@ -259,13 +302,13 @@ function App() {
       case 'abstract':
         return <AbstractPage />;
       case 'timeline':
-        return <TimelinePage exoplanets={exoplanets} />;
+        return <TimelinePage exoplanets={exoplanets} totalExoplanets={totalExoplanets} />;
       case 'methods':
         return <MethodsPage />;
       case 'ai':
         return <AIFrameworkPage />;
       case 'database':
-        return <DatabasePage exoplanets={exoplanets} loading={loading} searchTerm={searchTerm} setSearchTerm={setSearchTerm} />;
+        return <DatabasePage exoplanets={exoplanets} totalExoplanets={totalExoplanets} loading={loading} searchTerm={searchTerm} setSearchTerm={setSearchTerm} />;
       case 'future':
         return <FuturePage />;
       default:
@@ -435,7 +478,7 @@ function AbstractPage() {
 }
 
 // Timeline Page Component
-function TimelinePage({ exoplanets }) {
+function TimelinePage({ exoplanets, totalExoplanets }) {
   return (
     <section className="timeline-section">
       <h2>Exoplanet Discovery Timeline</h2>
@@ -459,7 +502,7 @@ function TimelinePage({ exoplanets }) {
           <div className="stat-card">
             <h3>2024</h3>
             <p>Current Total</p>
-            <span>{exoplanets.length.toLocaleString()}+ Exoplanets</span>
+            <span>{(totalExoplanets || exoplanets.length).toLocaleString()}+ Exoplanets</span>
           </div>
         </div>
       </div>
@@ -596,10 +639,10 @@ function AIFrameworkPage() {
 }
 
 // Database Page Component
-function DatabasePage({ exoplanets, loading, searchTerm, setSearchTerm }) {
+function DatabasePage({ exoplanets, totalExoplanets, loading, searchTerm, setSearchTerm }) {
   return (
     <section className="exoplanet-database">
-      <h2>🪐 Exoplanet Database ({exoplanets.length.toLocaleString()} Discoveries)</h2>
+      <h2>🪐 Exoplanet Database ({(totalExoplanets || exoplanets.length).toLocaleString()} Discoveries)</h2>
       <div className="database-controls">
         <input 
           type="text" 
@@ -657,9 +700,9 @@ function DatabasePage({ exoplanets, loading, searchTerm, setSearchTerm }) {
                   <span className="detail-value">{planet.discovery_method}</span>
                 </div>
               </div>
-              {planet.description && (
+              {planet.name && (
                 <div className="planet-description">
-                  <p>{planet.description}</p>
+                  <p>{describePlanet(planet)}</p>
                 </div>
               )}
             </div>
@@ -0,0 +1,25 @@
+// Client-side copy of ExoplanetScraper.generate_description (pipeline.py).
+// Exports written with --no-descriptions leave the sentence out of every
+// planet; the app renders it from the numeric fields instead.
+
+export const describePlanet = (planet) => {
+  if (planet.description) return planet.description;
+
+  const parts = [`${planet.name} is a ${String(planet.type || 'Unknown').toLowerCase()} exoplanet`];
+
+  if (planet.radius_earth > 0) {
+    parts.push(`with a radius of ${planet.radius_earth.toFixed(2)} Earth radii`);
+  }
+
+  if (planet.mass_earth > 0) {
+    parts.push(`and a mass of ${planet.mass_earth.toFixed(2)} Earth masses`);
+  }
+
+  if (planet.habitable === 'Yes') {
+    parts.push('located within the habitable zone of its star');
+  } else if (planet.habitable === 'No') {
+    parts.push('located outside the habitable zone');
+  }
+
+  return parts.join('. ') + '.';
+};
@@ -0,0 +1,81 @@
+# sync_state.py
+"""
+Incremental sync state for the NASA Exoplanet Archive scrapers
+- Persists a high-water mark (latest `rowupdate` seen) after each successful run
+- Falls back to `metadata.scrape_date` of an existing dataset when no state file exists
+- Merges delta rows into the existing dataset by planet name
+"""
+
+import json
+import os
+from datetime import datetime
+
+from atomic_io import write_json
+
+STATE_FILE = '.exoplanet_sync_state.json'
+
+
+def load_state(state_file=STATE_FILE):
+    """Return the saved sync state, or an empty dict if there is none"""
+    try:
+        with open(state_file, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(high_water_mark, total, state_file=STATE_FILE):
+    state = {
+        'high_water_mark': high_water_mark,
+        'last_run': datetime.now().isoformat(),
+        'total_exoplanets': total
+    }
+    write_json(state_file, state, indent=2)
+    return state
+
+
+def resolve_high_water_mark(state, data_file):
+    """Date (YYYY-MM-DD) to sync from, or None if a full scrape is needed"""
+    if not os.path.exists(data_file):
+        return None
+    if state.get('high_water_mark'):
+        return state['high_water_mark'][:10]
+    try:
+        with open(data_file, encoding='utf-8') as f:
+            scrape_date = json.load(f)['metadata']['scrape_date']
+        return scrape_date[:10]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+class HighWaterMark:
+    """Latest `rowupdate` of the planets that made it into the dataset.
+
+    collect() remembers each raw row's rowupdate by planet name; track() then advances
+    the mark only for the processed planets that come out the other end, so rows that
+    are dropped (nameless, null values, failed processing) never move it.
+    """
+
+    def __init__(self, value=None, key='pl_name'):
+        self.value = value
+        self.key = key
+        self.pending = {}
+
+    def collect(self, rows):
+        for row in rows:
+            self.pending[row.get(self.key)] = row.get('rowupdate')
+            yield row
+
+    def track(self, planets):
+        for planet in planets:
+            updated = self.pending.pop(planet['name'], None)
+            if updated and (self.value is None or str(updated) > self.value):
+                self.value = str(updated)
+            yield planet
+
+
+def merge_planets(existing, updates):
+    """Replace or add updated planets by name; returns a name-sorted list"""
+    merged = {planet['name']: planet for planet in existing}
+    merged.update((planet['name'], planet) for planet in updates)
+    return [merged[name] for name in sorted(merged)]
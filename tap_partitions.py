@@ -0,0 +1,82 @@
+# tap_partitions.py
+"""
+Partitioned TAP downloads
+- Splits one ADQL query into key-range slices (disc_year bands by default) that
+  together cover every row exactly once, rows with a null key included
+- Slices are fetched concurrently through the ConcurrentFetcher, whose worker pool
+  and per-host limit bound the parallelism; each slice is one small CSV response
+- At most max_workers slices are downloaded ahead of the consumer, so memory stays
+  bounded by a few slices rather than the whole table
+- A failed or timed-out slice is retried on its own with backoff, so a timeout
+  costs one slice instead of the whole download
+- Rows are yielded slice by slice in partition order, so the output is deterministic
+"""
+
+import time
+from datetime import date
+
+from tap_query import query_url
+from tap_stream import read_tap_rows
+
+PARTITION_COLUMN = 'disc_year'
+# Five-year bands while discoveries were rare, single years from the Kepler releases on
+FIRST_YEAR = 2000
+YEARLY_FROM = 2014
+
+
+def range_partitions(column, edges):
+    """ADQL conditions splitting `column` at `edges`: below, between, above, and null"""
+    edges = sorted(edges)
+    if not edges:
+        return [None]
+    conditions = [f"{column} < {edges[0]}"]
+    conditions += [f"{column} >= {low} and {column} < {high}" for low, high in zip(edges, edges[1:])]
+    conditions += [f"{column} >= {edges[-1]}", f"{column} is null"]
+    return conditions
+
+
+def discovery_year_partitions(last_year=None):
+    """Partitions on disc_year up to `last_year` (default: this year)"""
+    last_year = last_year or date.today().year
+    edges = list(range(FIRST_YEAR, YEARLY_FROM, 5)) + list(range(YEARLY_FROM, last_year + 1))
+    return range_partitions(PARTITION_COLUMN, edges)
+
+
+def partition_urls(table, partitions, extra_columns=(), where=None, available=None):
+    """One CSV TAP/sync URL per partition, each restricted by its condition (and `where`)"""
+    urls = []
+    for condition in partitions:
+        clauses = [f"({clause})" for clause in (where, condition) if clause]
+        urls.append(query_url(table, 'csv', extra_columns, ' and '.join(clauses) or None, available))
+    return urls
+
+
+def fetch_partitioned(fetcher, table, partitions=None, extra_columns=(), where=None,
+                      retries=2, backoff=2.0, timeout=30, available=None):
+    """Yield the rows of a query over `table`, downloaded in partitions.
+
+    Partitions download concurrently; one that fails is retried alone (up to
+    `retries` times, doubling `backoff` seconds in between) while the others
+    keep downloading. Raises RuntimeError if a partition still fails, since
+    carrying on would silently drop its rows. `available` restricts the selected
+    columns as in tap_query.select_query.
+    """
+    partitions = partitions or discovery_year_partitions()
+    urls = partition_urls(table, partitions, extra_columns, where, available)
+    results = fetcher.fetch_all(urls, handler=read_tap_rows, timeout=timeout, window=fetcher.max_workers)
+    for i, url, rows, error in results:
+        attempt = 0
+        while error is not None:
+            if attempt == retries:
+                raise RuntimeError(f"partition {partitions[i]!r} failed after {retries} retries: {error}") from error
+            delay = backoff * 2 ** attempt
+            attempt += 1
+            print(f"  🔄 Partition {i+1}/{len(urls)} failed ({error}), retry {attempt}/{retries} in {delay:.0f}s")
+            time.sleep(delay)
+            try:
+                rows, error = fetcher.fetch(url, handler=read_tap_rows, timeout=timeout), None
+            except Exception as e:
+                error = e
+        print(f"  ✅ Partition {i+1}/{len(urls)} ({partitions[i] or 'all rows'}): {len(rows)} rows")
+        yield from rows
+        rows = None
@@ -0,0 +1,103 @@
+# tap_query.py
+"""
+Schema-driven ADQL for the NASA Exoplanet Archive scrapers
+- One field schema maps every planet field to the archive column it is read from;
+  process_planet_data and the batch path both build planets from it
+- select_query() requests exactly those columns (plus any extras such as rowupdate),
+  each once, so a query can't fetch columns nobody reads or miss one that is read
+- query_url() URL-encodes the ADQL into a TAP/sync endpoint
+- archive_columns() reads the columns a table really has from TAP_SCHEMA.columns, so a
+  query can leave out any the archive doesn't publish instead of failing outright
+- MINIMAL_COLUMNS is the small column set of the original fallback query, which is
+  known to work against `ps` when the full query does not
+"""
+
+from tap_stream import stream_tap_rows, tap_url
+
+# (planet field, archive column) for the values copied straight from the row, in output order.
+# Column names are those of the ps/pscomppars tables; None marks a field the planet
+# tables do not publish (st_logg is the star's gravity), which is always 0
+NUMERIC_FIELD_COLUMNS = [
+    ('radius_earth', 'pl_rade'),
+    ('mass_earth', 'pl_bmasse'),
+    ('mass_jupiter', 'pl_bmassj'),
+    ('radius_jupiter', 'pl_radj'),
+    ('orbital_period_days', 'pl_orbper'),
+    ('semi_major_axis_au', 'pl_orbsmax'),
+    ('eccentricity', 'pl_orbeccen'),
+    ('inclination_deg', 'pl_orbincl'),
+    ('equilibrium_temp_k', 'pl_eqt'),
+    ('insolation_earth', 'pl_insol'),
+    ('density_g_cm3', 'pl_dens'),
+    ('surface_gravity_ms2', None),
+    ('transit_depth_ppm', 'pl_trandep'),
+    ('transit_duration_hours', 'pl_trandur'),
+]
+
+# (archive column, method) behind discovery_method: a positive value means detected
+DISCOVERY_COLUMNS = [
+    ('pl_trandep', 'Transit'),
+    ('pl_rvamp', 'Radial Velocity'),
+    ('pl_imppar', 'Microlensing'),
+]
+
+NAME_COLUMN = 'pl_name'
+HOST_COLUMN = 'hostname'
+
+# Archive column behind each planet field, for code that reads one field's column
+FIELD_COLUMNS = dict(NUMERIC_FIELD_COLUMNS)
+
+
+def unique(columns):
+    """Columns in first-seen order, each once"""
+    return list(dict.fromkeys(columns))
+
+
+# Every column processing reads, each once
+PLANET_COLUMNS = unique([NAME_COLUMN, HOST_COLUMN]
+                        + [column for _, column in NUMERIC_FIELD_COLUMNS if column]
+                        + [column for column, _ in DISCOVERY_COLUMNS])
+
+# Columns of the original minimal fallback query
+MINIMAL_COLUMNS = [NAME_COLUMN, HOST_COLUMN, 'pl_orbper', 'pl_rade', 'pl_bmasse', 'pl_eqt']
+
+
+def field_values(row):
+    """{planet field: value} for the values copied straight from a row; missing reads as 0"""
+    return {field: row.get(column, 0) if column else 0 for field, column in NUMERIC_FIELD_COLUMNS}
+
+
+def select_query(table, extra_columns=(), where=None, available=None):
+    """ADQL selecting the planet columns (and extra_columns) from `table`.
+
+    With `available` (a collection of column names) only the columns in it are
+    selected; processing reads the others as missing.
+    """
+    columns = unique([*PLANET_COLUMNS, *extra_columns])
+    if available is not None:
+        columns = [column for column in columns if column in available]
+    query = f"select {','.join(columns)} from {table}"
+    if where:
+        query += f" where {where}"
+    return query
+
+
+def query_url(table, fmt='json', extra_columns=(), where=None, available=None):
+    """TAP/sync endpoint for select_query(...)"""
+    return tap_url(select_query(table, extra_columns, where, available), fmt)
+
+
+def archive_columns(session, table, timeout=30):
+    """Set of the columns `table` has according to TAP_SCHEMA.columns, or None if unknown"""
+    query = f"select column_name from TAP_SCHEMA.columns where table_name like '{table}'"
+    try:
+        columns = {row['column_name'] for row in stream_tap_rows(session, tap_url(query), timeout)}
+    except Exception as e:
+        print(f"  ⚠️ Could not read the {table} schema ({e}); querying every column")
+        return None
+    if not columns:
+        return None
+    missing = [column for column in PLANET_COLUMNS if column not in columns]
+    if missing:
+        print(f"  ⚠️ {table} has no column {', '.join(missing)}; leaving it out of the query")
+    return columns
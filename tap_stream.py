@@ -0,0 +1,65 @@
+# tap_stream.py
+"""
+Streaming reader for NASA Exoplanet Archive TAP queries
+- Requests results as CSV and reads the response line by line
+- Yields one dict per row, typed like the archive's JSON output
+- Never holds more than one row of the response in memory (read_tap_rows parses an
+  already downloaded response, e.g. one slice of a partitioned download)
+"""
+
+import csv
+import io
+from urllib.parse import quote_plus
+
+TAP_SYNC_URL = "https://exoplanetarchive.ipac.caltech.edu/TAP/sync"
+
+# Columns returned as text; every other archive column is numeric
+STRING_COLUMNS = {'pl_name', 'hostname', 'rowupdate', 'discoverymethod'}
+
+
+def tap_url(query, fmt='csv'):
+    """Build a TAP/sync URL for an ADQL query"""
+    return f"{TAP_SYNC_URL}?query={quote_plus(query)}&format={fmt}"
+
+
+def convert_value(column, value):
+    """Convert a CSV cell to the type the JSON format would have returned"""
+    if value == '':
+        return None
+    if column in STRING_COLUMNS:
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def iter_csv_rows(lines):
+    """Yield typed row dicts from an iterable of CSV lines (header first)"""
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if not header:
+        return
+    for values in reader:
+        if not values:
+            continue
+        yield {column: convert_value(column, value) for column, value in zip(header, values)}
+
+
+def stream_tap_rows(session, url, timeout=30, headers=None):
+    """Issue a TAP query with format=csv and yield its rows as they arrive"""
+    with session.get(url, timeout=timeout, stream=True, headers=headers) as response:
+        response.raise_for_status()
+        # TAP serves text/csv without a charset; requests would assume latin-1
+        response.encoding = 'utf-8'
+        yield from iter_csv_rows(response.iter_lines(decode_unicode=True))
+
+
+def read_tap_rows(response):
+    """Typed rows of a complete (non-streamed) CSV TAP response"""
+    response.encoding = 'utf-8'
+    return list(iter_csv_rows(io.StringIO(response.text)))
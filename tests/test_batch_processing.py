@@ -0,0 +1,100 @@
+import itertools
+import random
+
+import pytest
+
+import batch_processing
+from batch_processing import (classify_planet_types, determine_discovery_methods, determine_habitability,
+                              iter_processed_batches, numeric_column, process_batch)
+from pipeline import ExoplanetScraper
+from tap_query import DISCOVERY_COLUMNS, FIELD_COLUMNS, PLANET_COLUMNS
+
+pytest.importorskip('numpy')
+
+# Values seen in (or close to) typed TAP rows: nulls, blanks, stray strings, bools,
+# negatives and every classification boundary
+SAMPLE_VALUES = [None, '', 'n/a', True, False, 0, 0.0, -1.5, 0.1, 0.3, 0.5, 0.8, 1.0,
+                 1.25, 1.7, 2.0, 5.99, 6.0, 12, 318.0]
+NAMES = ['Kepler-22 b', 'TRAPPIST-1 e', 'Unknown', '', None]
+
+
+def random_rows(count, seed):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        row = {}
+        for column in PLANET_COLUMNS:
+            roll = rng.random()
+            if roll < 0.1:
+                continue  # column missing from the row
+            if column == 'pl_name':
+                row[column] = rng.choice(NAMES) if roll < 0.3 else f"Planet-{i}"
+            elif column == 'hostname':
+                row[column] = rng.choice([None, '', f"Star-{i}"])
+            elif roll < 0.6:
+                row[column] = rng.choice(SAMPLE_VALUES)
+            else:
+                row[column] = round(rng.uniform(-1, 20), 3)
+        rows.append(row)
+    return rows
+
+
+@pytest.fixture
+def scraper():
+    return ExoplanetScraper.__new__(ExoplanetScraper)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_batch_matches_per_row_processing(scraper, seed):
+    rows = random_rows(1000, seed)
+    expected = [planet for planet in map(scraper.process_planet_data, rows) if planet]
+    assert expected, 'sample should keep some rows'
+    assert len(expected) < len(rows), 'sample should drop some rows'
+    assert process_batch(rows, scraper) == expected
+
+
+def test_batches_split_anywhere_give_the_same_planets(scraper):
+    rows = random_rows(250, seed=42)
+    expected = process_batch(rows, scraper)
+    for size in (1, 7, 100, 1000):
+        assert list(iter_processed_batches(rows, scraper, size)) == expected
+
+
+def test_empty_batch(scraper):
+    assert process_batch([], scraper) == []
+
+
+# Exhaustive grids over each vectorized classifier against its per-row counterpart
+GRID = [None, 'n/a', -1.0, 0, 0.05, 0.1, 0.3, 0.5, 0.8, 1.0, 1.25, 1.7, 1.71, 2.0, 2.01, 6.0, 30.0]
+
+
+def test_planet_type_grid(scraper):
+    rows = [{'pl_rade': radius, 'pl_bmassj': mass_jupiter} for radius in GRID for mass_jupiter in GRID]
+    radius, radius_ok = numeric_column(rows, FIELD_COLUMNS['radius_earth'])
+    mass_jupiter, mass_jupiter_ok = numeric_column(rows, FIELD_COLUMNS['mass_jupiter'])
+    expected = [scraper.classify_planet_type(row['pl_rade'], 0, row['pl_bmassj']) for row in rows]
+    assert classify_planet_types(radius, radius_ok, mass_jupiter, mass_jupiter_ok).tolist() == expected
+
+
+def test_habitability_grid(scraper):
+    rows = [{'pl_insol': insolation, 'pl_rade': radius} for insolation in GRID for radius in GRID]
+    insolation, insolation_ok = numeric_column(rows, FIELD_COLUMNS['insolation_earth'])
+    radius, radius_ok = numeric_column(rows, FIELD_COLUMNS['radius_earth'])
+    expected = [scraper.determine_habitability(row['pl_insol'], row['pl_rade']) for row in rows]
+    assert determine_habitability(insolation, insolation_ok, radius, radius_ok).tolist() == expected
+
+
+def test_discovery_method_grid(scraper):
+    values = [None, 0, -2.0, 0.4, 310]
+    rows = [dict(zip([column for column, _ in DISCOVERY_COLUMNS], combo))
+            for combo in itertools.product(values, repeat=len(DISCOVERY_COLUMNS))]
+    detections = [numeric_column(rows, column, nullable=True)[0] for column, _ in DISCOVERY_COLUMNS]
+    expected = [scraper.determine_discovery_method(row) for row in rows]
+    assert determine_discovery_methods(detections).tolist() == expected
+
+
+def test_without_numpy_falls_back_to_the_per_row_path(scraper, monkeypatch):
+    rows = random_rows(200, seed=7)
+    expected = process_batch(rows, scraper)
+    monkeypatch.setattr(batch_processing, 'np', None)
+    assert process_batch(rows, scraper) == expected
@@ -0,0 +1,34 @@
+import struct
+
+from columnar_export import MAGIC, SCHEMA, read_columnar, write_columnar
+
+PLANETS = [
+    {'name': 'Kepler-22 b', 'host_star': 'Kepler-22', 'type': 'Super Earth', 'habitable': 'Yes',
+     'radius_earth': 2.4, 'mass_earth': 9.1, 'discovery_method': 'Transit', 'description': 'Ünïcode ☄'},
+    {'name': 'Proxima Cen b', 'host_star': 'Proxima Cen', 'type': 'Terrestrial', 'habitable': 'Yes',
+     'radius_earth': 1.07, 'mass_earth': None, 'discovery_method': 'Radial Velocity'},
+]
+
+
+def test_round_trip(tmp_path):
+    filename = str(tmp_path / 'planets.columns.bin')
+    write_columnar(PLANETS, filename)
+    columns = read_columnar(filename)
+
+    assert list(columns) == [key for key, _ in SCHEMA]
+    assert columns['name'] == ['Kepler-22 b', 'Proxima Cen b']
+    assert columns['type'] == ['Super Earth', 'Terrestrial']
+    assert columns['radius_earth'] == [2.4, 1.07]
+    assert columns['mass_earth'] == [9.1, None]
+    assert columns['eccentricity'] == [None, None]
+    assert columns['description'] == ['Ünïcode ☄', '']
+
+
+def test_layout_is_aligned_and_selective(tmp_path):
+    filename = str(tmp_path / 'planets.columns.bin')
+    write_columnar(PLANETS, filename)
+    with open(filename, 'rb') as f:
+        blob = f.read()
+    assert blob[:4] == MAGIC
+    assert (8 + struct.unpack('<I', blob[4:8])[0]) % 8 == 0
+    assert read_columnar(filename, columns=['habitable']) == {'habitable': ['Yes', 'Yes']}
@@ -0,0 +1,136 @@
+import gc
+import threading
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from http_cache import ResponseCache, mount_cache
+from scheduler import page_fingerprint
+
+
+class Page:
+    body = b'version 1'
+    etag = '"v1"'
+    cache_control = 'max-age=3600'
+    hits = 0
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        Page.hits += 1
+        if Page.etag and self.headers.get('If-None-Match') == Page.etag:
+            self.send_response(304)
+            self.send_header('ETag', Page.etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        if Page.etag:
+            self.send_header('ETag', Page.etag)
+        if Page.cache_control:
+            self.send_header('Cache-Control', Page.cache_control)
+        self.send_header('Content-Length', str(len(Page.body)))
+        self.end_headers()
+        self.wfile.write(Page.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Page.body, Page.etag, Page.cache_control, Page.hits = b'version 1', '"v1"', 'max-age=3600', 0
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/page"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def session(tmp_path):
+    s = requests.Session()
+    mount_cache(s, ResponseCache(str(tmp_path / 'cache')))
+    yield s
+    s.close()
+
+
+def test_fresh_entry_is_served_without_a_request(server, session):
+    assert session.get(server).content == b'version 1'
+    cached = session.get(server)
+    assert cached.content == b'version 1'
+    assert cached.from_cache and not cached.revalidated
+    assert Page.hits == 1
+
+
+def test_no_cache_request_revalidates_fresh_entry(server, session):
+    session.get(server)
+    probe = session.get(server, headers={'Cache-Control': 'no-cache'})
+    assert probe.revalidated and probe.content == b'version 1'
+    assert Page.hits == 2
+
+
+def test_page_fingerprint_sees_change_within_ttl(server, session):
+    assert page_fingerprint(session, server) == '"v1"'
+    Page.body, Page.etag = b'version 2', '"v2"'
+    assert page_fingerprint(session, server) == '"v2"'
+
+
+def test_response_without_cache_headers_is_revalidated(server, session):
+    Page.cache_control = None
+    session.get(server)
+    again = session.get(server)
+    assert again.revalidated and again.content == b'version 1'
+    assert Page.hits == 2
+
+
+def test_response_without_headers_or_validators_is_refetched(server, session, tmp_path):
+    Page.cache_control, Page.etag = None, None
+    session.get(server)
+    Page.body = b'version 2'
+    again = session.get(server)
+    assert not again.from_cache and again.content == b'version 2'
+    assert Page.hits == 2
+    assert not any((tmp_path / 'cache').iterdir())
+
+
+def test_callers_can_opt_into_a_default_ttl(server, tmp_path):
+    Page.cache_control = None
+    with requests.Session() as s:
+        mount_cache(s, ResponseCache(str(tmp_path / 'cache'), default_ttl=60))
+        s.get(server)
+        assert s.get(server).from_cache
+    assert Page.hits == 1
+
+
+def unclosed_files(action):
+    """ResourceWarnings for files left open by `action`"""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', ResourceWarning)
+        action()
+        gc.collect()
+    return [w for w in caught if issubclass(w.category, ResourceWarning) and 'file' in str(w.message)]
+
+
+def test_cached_bodies_do_not_leak_file_handles(server, session):
+    def fetch_three_ways():
+        assert session.get(server).content == b'version 1'           # stored
+        assert session.get(server).content == b'version 1'           # fresh
+        assert session.get(server, headers={'Cache-Control': 'no-cache'}).text == 'version 1'  # 304
+
+    assert unclosed_files(fetch_three_ways) == []
+
+
+def test_streamed_cached_body_is_closed_once_read(server, session):
+    session.get(server)
+
+    def stream():
+        with session.get(server, stream=True) as response:
+            assert response.from_cache
+            assert list(response.iter_lines()) == [b'version 1']
+        response = session.get(server, stream=True)
+        assert response.content == b'version 1'
+
+    assert unclosed_files(stream) == []
@@ -0,0 +1,94 @@
+import json
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+from urllib.parse import urljoin
+
+from nasa_exoplanets_scraper import PARSER, parse_page
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+URL = 'https://science.nasa.gov/exoplanets/'
+
+
+def baseline_parse_page(html, base_url):
+    """parse_page verbatim from before the single-pass rewrite (one find_all per element kind)"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title = soup.title.string.strip() if soup.title and soup.title.string else None
+    meta_desc = None
+    desc_tag = soup.find('meta', attrs={'name':'description'})
+    if desc_tag and desc_tag.get('content'):
+        meta_desc = desc_tag['content'].strip()
+
+    main = None
+    for candidate in ('main', 'article', 'div#content', 'div#primary', 'div.main-content'):
+        main = soup.select_one(candidate)
+        if main:
+            break
+    if not main:
+        main = soup.body or soup
+
+    headings = []
+    for h in main.find_all(['h1','h2','h3','h4']):
+        text = h.get_text(separator=' ', strip=True)
+        if text:
+            headings.append({'tag': h.name, 'text': text})
+
+    paragraphs = []
+    for p in main.find_all('p'):
+        txt = p.get_text(separator=' ', strip=True)
+        if txt:
+            paragraphs.append(txt)
+
+    images = []
+    for img in main.find_all('img'):
+        src = img.get('src') or img.get('data-src')
+        if not src:
+            continue
+        src = urljoin(base_url, src)
+        images.append({'src': src, 'alt': img.get('alt', '')})
+
+    links = []
+    for a in main.find_all('a', href=True):
+        href = a['href'].strip()
+        full = urljoin(base_url, href)
+        text = a.get_text(separator=' ', strip=True)
+        links.append({'text': text, 'href': full})
+
+    return {
+        'url': base_url,
+        'title': title,
+        'meta_description': meta_desc,
+        'headings': headings,
+        'paragraphs': paragraphs,
+        'images': images,
+        'links': links
+    }
+
+
+MALFORMED = [
+    '<p>a<p>b<ul><li><a href="/q">q</a></ul>',
+    '<main><h2>Title <p>inside heading</h2><p>after</main>',
+    '<div id="content"><p>one<img src="x.png"><p>two <a href="y">link</div>',
+    '<body><h1>A<h2>B</h1><p><p></body>',
+]
+
+
+def test_default_parser_is_html_parser():
+    assert PARSER == 'html.parser'
+
+
+def test_bundled_page_matches_baseline_output():
+    # nasa_exoplanets.expected.json was written by the multi-pass parser above, run on the stored page
+    with open(os.path.join(FIXTURES, 'nasa_exoplanets.html'), encoding='utf-8') as f:
+        html = f.read()
+    with open(os.path.join(FIXTURES, 'nasa_exoplanets.expected.json'), encoding='utf-8') as f:
+        expected = json.load(f)
+    assert baseline_parse_page(html, URL) == expected
+    assert parse_page(html, URL) == expected
+
+
+@pytest.mark.parametrize('html', MALFORMED)
+def test_malformed_html_matches_baseline(html):
+    assert parse_page(html, URL) == baseline_parse_page(html, URL)
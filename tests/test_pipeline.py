@@ -0,0 +1,210 @@
+import csv
+import io
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from fetcher import ConcurrentFetcher
+from comprehensive_exoplanet_scraper import ComprehensiveExoplanetScraper
+from pipeline import Pipeline, json_endpoints_source, unique_by_name
+from simple_exoplanet_scraper import SimpleExoplanetScraper
+from tap_query import MINIMAL_COLUMNS, PLANET_COLUMNS
+from working_exoplanet_scraper import WorkingExoplanetScraper
+
+COLUMNS = ['pl_name', 'hostname', 'pl_rade', 'pl_bmasse', 'pl_bmassj', 'pl_insol', 'pl_trandep', 'rowupdate']
+ROWS = [
+    # Two solutions of the same planet: the more complete one must win
+    ['Kepler-22 b', 'Kepler-22', '2.1', '', '', '1.1', '', '2015-01-01'],
+    ['Kepler-22 b', 'Kepler-22', '2.4', '9.1', '', '1.1', '490', '2012-06-30'],
+    ['Proxima Cen b', 'Proxima Cen', '1.07', '1.07', '', '0.65', '', '2023-02-14'],
+    ['51 Peg b', '51 Peg', '', '', '0.46', '', '', '2020-08-01'],   # null radius/mass: dropped
+    ['', 'Nameless', '1.0', '1.0', '', '1.0', '', '2024-01-01'],    # no name: dropped
+]
+
+
+def csv_body(rows):
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(COLUMNS)
+    writer.writerows(rows)
+    return out.getvalue().encode('utf-8')
+
+
+def selected_columns(query):
+    return query[len('select '):query.index(' from ')].split(',')
+
+
+class FakeTapSession:
+    """Answers TAP/sync CSV queries from fixed rows; tables in `failing` raise.
+
+    TAP_SCHEMA lookups list `schema` (every planet column by default) or fail when it is None.
+    """
+
+    def __init__(self, rows=ROWS, failing=(), schema=PLANET_COLUMNS):
+        self.body = csv_body(rows)
+        self.failing = failing
+        self.schema = schema
+        self.tables = []
+        self.queries = []
+        self.headers = {}
+
+    def get(self, url, timeout=None, stream=False, headers=None):
+        query = parse_qs(urlparse(url).query)['query'][0]
+        table = query.split(' from ', 1)[1].split()[0]
+        if table == 'TAP_SCHEMA.columns':
+            if self.schema is None:
+                raise requests.ConnectionError('no schema')
+            body = '\n'.join(['column_name', *self.schema, 'rowupdate']).encode('utf-8')
+        else:
+            self.tables.append(table)
+            self.queries.append(query)
+            if table in self.failing:
+                raise requests.ConnectionError(f"{table} unavailable")
+            body = self.body
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        pass
+
+
+def scraper_for(session, **kwargs):
+    return WorkingExoplanetScraper(fetcher=ConcurrentFetcher(session=session, rate=1000, burst=100), **kwargs)
+
+
+def test_pipeline_chains_source_and_stages():
+    pipeline = Pipeline(lambda: iter([{'name': 'a'}, {'name': 'b'}, {'name': 'a'}]), unique_by_name)
+    assert [planet['name'] for planet in pipeline] == ['a', 'b']
+    assert pipeline.into(list) == [{'name': 'a'}, {'name': 'b'}]
+
+
+def test_working_scraper_dedups_and_processes():
+    session = FakeTapSession()
+    scraper = scraper_for(session)
+    planets = list(scraper.iter_processed_planets())
+
+    assert session.tables == ['pscomppars']
+    assert [planet['name'] for planet in planets] == ['Kepler-22 b', 'Proxima Cen b']
+    kepler, proxima = planets
+    assert kepler['radius_earth'] == 2.4 and kepler['mass_earth'] == 9.1
+    assert kepler['discovery_method'] == 'Transit'
+    assert kepler['type'] == 'Mini Neptune' and kepler['habitable'] == 'No'
+    assert proxima['type'] == 'Terrestrial' and proxima['habitable'] == 'Yes'
+    assert proxima['description'].startswith('Proxima Cen b is a terrestrial exoplanet')
+    # The nameless 2024 row and dropped 51 Peg b row do not move the mark
+    assert scraper.high_water_mark.value == '2023-02-14'
+
+
+def test_failed_endpoint_falls_back_to_default_solutions():
+    session = FakeTapSession(failing=('pscomppars',))
+    planets = list(scraper_for(session).iter_processed_planets())
+    assert session.tables == ['pscomppars', 'ps']
+    assert len(planets) == 2
+    # The fallback is the original minimal query, so one unknown column can't sink both
+    assert sorted(selected_columns(session.queries[1])) == sorted(MINIMAL_COLUMNS)
+
+
+def test_columns_missing_from_the_archive_are_left_out():
+    session = FakeTapSession(schema=[column for column in PLANET_COLUMNS if column != 'pl_orbsmax'])
+    planets = list(scraper_for(session).iter_processed_planets())
+    columns = selected_columns(session.queries[0])
+    assert 'pl_orbsmax' not in columns and 'pl_rade' in columns and 'rowupdate' in columns
+    assert planets[0]['semi_major_axis_au'] == 0
+
+
+def test_unknown_schema_queries_every_column():
+    session = FakeTapSession(schema=None)
+    list(scraper_for(session).iter_processed_planets())
+    assert selected_columns(session.queries[0]) == [*PLANET_COLUMNS, 'rowupdate']
+
+
+def test_scrape_to_file_without_descriptions(tmp_path):
+    filename = str(tmp_path / 'all_exoplanets.json')
+    scraper = scraper_for(FakeTapSession(), include_descriptions=False)
+    assert scraper.scrape_to_file(filename) == (filename, 2)
+
+    with open(filename, encoding='utf-8') as f:
+        data = json.load(f)
+    assert data['metadata']['total_exoplanets'] == 2
+    assert data['metadata']['source'] == WorkingExoplanetScraper.SOURCE
+    assert all('description' not in planet for planet in data['exoplanets'])
+
+
+def test_json_endpoints_source_with_first_seen_dedup():
+    class JsonSession(FakeTapSession):
+        def get(self, url, timeout=None, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps([{'name': 'b', 'radius_earth': float(url[-1])}]).encode('utf-8')
+            return response
+
+    fetcher = ConcurrentFetcher(session=JsonSession(), rate=1000, burst=100)
+    source = json_endpoints_source(fetcher, ['https://example.org/tap?q=1', 'https://example.org/tap?q=2'])
+    assert list(Pipeline(source, unique_by_name)) == [{'name': 'b', 'radius_earth': 1.0}]
+
+
+@pytest.mark.parametrize('scraper_class, table', [(SimpleExoplanetScraper, 'pscomppars'),
+                                                   (ComprehensiveExoplanetScraper, 'ps')])
+def test_every_scraper_uses_the_streamed_best_solution_path(scraper_class, table):
+    names = []
+    for rows in (ROWS, ROWS[::-1]):
+        session = FakeTapSession(rows)
+        scraper = scraper_class(fetcher=ConcurrentFetcher(session=session, rate=1000, burst=100))
+        planets = list(scraper.iter_processed_planets())
+        assert session.tables == [table]
+        names.append([(planet['name'], planet['mass_earth']) for planet in planets])
+    # Same planets and the same chosen solutions whatever order the rows arrive in
+    assert names[0] == names[1] == [('Kepler-22 b', 9.1), ('Proxima Cen b', 1.07)]
+
+
+def test_json_endpoints_are_downloaded_one_ahead_at_most():
+    fetched = []
+
+    class CountingSession(FakeTapSession):
+        def get(self, url, timeout=None, **kwargs):
+            fetched.append(url)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps([{'name': url}]).encode('utf-8')
+            return response
+
+    fetcher = ConcurrentFetcher(session=CountingSession(), max_workers=4, rate=1000, burst=100)
+    endpoints = [f"https://example.org/tap?q={i}" for i in range(8)]
+    consumed = 0
+    for _ in json_endpoints_source(fetcher, endpoints)():
+        consumed += 1
+        assert len(fetched) <= consumed + 1
+    assert consumed == 8
+
+
+def test_failed_stream_leaves_no_spool_file_and_keeps_the_old_dataset(tmp_path):
+    filename = tmp_path / 'all_exoplanets.json'
+    filename.write_text('{"exoplanets": []}', encoding='utf-8')
+
+    def broken():
+        yield {'name': 'b'}
+        raise ConnectionError('archive went away')
+
+    scraper = scraper_for(FakeTapSession())
+    with pytest.raises(ConnectionError):
+        scraper.save_data_stream(broken(), str(filename))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['all_exoplanets.json']
+    assert filename.read_text(encoding='utf-8') == '{"exoplanets": []}'
+
+
+def test_incremental_sync_saves_the_mark_of_kept_planets_only(tmp_path):
+    filename, state_file = str(tmp_path / 'all_exoplanets.json'), str(tmp_path / 'state.json')
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump({'metadata': {'scrape_date': '2022-01-01T00:00:00'}, 'exoplanets': []}, f)
+
+    session = FakeTapSession()
+    assert scraper_for(session).scrape_incremental(filename, state_file) == (filename, 2)
+    assert "to_date('2022-01-01'" in session.queries[0]
+    with open(state_file, encoding='utf-8') as f:
+        assert json.load(f)['high_water_mark'] == '2023-02-14'
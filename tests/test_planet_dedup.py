@@ -0,0 +1,42 @@
+import itertools
+
+from planet_dedup import SolutionMerger, best_solutions, solution_rank
+
+
+def test_more_complete_solution_wins_over_newer():
+    sparse = {'pl_name': 'b', 'pl_rade': 1.1, 'pl_bmasse': None, 'rowupdate': '2024-05-01'}
+    full = {'pl_name': 'b', 'pl_rade': 1.2, 'pl_bmasse': 3.0, 'rowupdate': '2019-01-01'}
+    assert solution_rank(full) > solution_rank(sparse)
+
+
+def test_blank_strings_do_not_count_as_values():
+    blank = {'pl_name': 'b', 'pl_rade': '', 'rowupdate': '2024-05-01'}
+    older = {'pl_name': 'b', 'pl_rade': 1.0, 'rowupdate': '2010-01-01'}
+    assert solution_rank(older) > solution_rank(blank)
+
+
+def test_newer_solution_wins_between_equally_complete():
+    old = {'pl_name': 'b', 'pl_rade': 1.0, 'rowupdate': '2015-03-02'}
+    new = {'pl_name': 'b', 'pl_rade': 1.3, 'rowupdate': '2021-11-30'}
+    missing_date = {'pl_name': 'b', 'pl_rade': 1.3, 'rowupdate': None}
+    assert solution_rank(new) > solution_rank(old) > solution_rank(missing_date)
+
+
+def test_choice_does_not_depend_on_row_order():
+    rows = [
+        {'pl_name': 'b', 'pl_rade': 1.0, 'rowupdate': '2020-01-01'},
+        {'pl_name': 'b', 'pl_rade': 2.0, 'rowupdate': '2020-01-01'},
+        {'pl_name': 'b', 'pl_rade': 3.0, 'rowupdate': '2020-01-01'},
+        {'pl_name': 'c', 'pl_rade': 1.0, 'rowupdate': '2020-01-01'},
+    ]
+    results = {tuple(map(repr, best_solutions(order))) for order in itertools.permutations(rows)}
+    assert len(results) == 1
+
+
+def test_one_row_per_planet_sorted_by_name():
+    rows = [{'pl_name': name, 'pl_rade': i} for i, name in enumerate(['c', 'a', 'b', 'a', '', None])]
+    merger = SolutionMerger()
+    for row in rows:
+        merger.add(row)
+    assert [row['pl_name'] for row in merger] == ['a', 'b', 'c']
+    assert merger.rows_seen == 4
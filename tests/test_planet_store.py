@@ -0,0 +1,49 @@
+import pytest
+
+from planet_store import PlanetStore
+
+
+def planet(name, **fields):
+    return {'name': name, 'host_star': 'Star', 'type': 'Terrestrial', 'habitable': 'No',
+            'radius_earth': 1.0, 'mass_earth': 1.0, 'description': f"{name} is a planet.", **fields}
+
+
+def test_replace_stream_replaces_table(tmp_path):
+    store = PlanetStore(str(tmp_path / 'planets.db'))
+    store.upsert([planet('A'), planet('B')])
+    assert [p['name'] for p in store.replace_stream([planet('C')])] == ['C']
+    assert [p['name'] for p in store.iter_planets()] == ['C']
+
+
+def test_empty_stream_keeps_existing_rows(tmp_path):
+    store = PlanetStore(str(tmp_path / 'planets.db'))
+    store.upsert([planet('A'), planet('B')])
+    assert list(store.replace_stream(iter([]))) == []
+    assert store.count() == 2
+
+
+def test_failed_stream_rolls_back(tmp_path):
+    store = PlanetStore(str(tmp_path / 'planets.db'))
+    store.upsert([planet('A')])
+
+    def broken():
+        yield planet('B')
+        raise ConnectionError('archive went away')
+
+    with pytest.raises(ConnectionError):
+        list(store.replace_stream(broken()))
+    assert [p['name'] for p in store.iter_planets()] == ['A']
+
+
+def test_search_cli_handles_stores_without_descriptions(tmp_path, capsys):
+    from planet_store import main
+    db = str(tmp_path / 'planets.db')
+    store = PlanetStore(db)
+    bare = planet('Kepler-22 b')
+    del bare['description']
+    store.upsert([bare, planet('Kepler-90 h')])
+    assert 'description' not in store.get('Kepler-22 b')
+    store.close()
+    main(['--db', db, 'search', 'Kepler'])
+    out = capsys.readouterr().out.splitlines()
+    assert sorted(out) == ['Kepler-22 b', 'Kepler-90 h: Kepler-90 h is a planet.']
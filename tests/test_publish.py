@@ -0,0 +1,48 @@
+import json
+import os
+
+import paged_export
+import publish
+from publish import MANIFEST_NAME, publish_files
+
+
+def write_dataset(path, planets):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'metadata': {'total_exoplanets': len(planets)}, 'exoplanets': planets}, f)
+
+
+def planets(count, tag=''):
+    return [{'name': f"P{i}{tag}", 'type': 'Terrestrial', 'habitable': 'No'} for i in range(count)]
+
+
+def test_files_and_pages_go_live_in_one_manifest_write(tmp_path, monkeypatch):
+    public = tmp_path / 'public'
+    public.mkdir()
+    dataset = tmp_path / 'all_exoplanets.json'
+    write_dataset(dataset, planets(120))
+
+    writes = []
+    real_write = publish.write_manifest
+    monkeypatch.setattr(publish, 'write_manifest', lambda d, m: (writes.append(dict(m['files'])), real_write(d, m)))
+    monkeypatch.setattr(paged_export, 'write_manifest', lambda d, m: writes.append('paged_export'))
+
+    entries = publish_files([str(dataset)], str(public), pages_from=str(dataset))
+
+    assert len(writes) == 1
+    assert set(writes[0]) == {'all_exoplanets.json', paged_export.INDEX_NAME}
+    manifest = json.loads((public / MANIFEST_NAME).read_text(encoding='utf-8'))
+    index_path = manifest['files'][paged_export.INDEX_NAME]['path']
+    assert index_path == entries[paged_export.INDEX_NAME]['path']
+    assert (public / index_path.lstrip('/')).exists()
+
+
+def test_old_page_exports_are_pruned_after_the_switch(tmp_path):
+    public = tmp_path / 'public'
+    public.mkdir()
+    dataset = tmp_path / 'all_exoplanets.json'
+    for tag in ('a', 'b', 'c'):
+        write_dataset(dataset, planets(10, tag))
+        entries = publish_files([str(dataset)], str(public), pages_from=str(dataset))
+    exports = os.listdir(public / 'planets')
+    assert len(exports) == 2
+    assert entries[paged_export.INDEX_NAME]['hash'] in exports
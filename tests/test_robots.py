@@ -0,0 +1,120 @@
+import pytest
+
+from robots import RobotsCache, RobotsRules
+
+ROBOTS_TXT = """
+User-agent: *
+Disallow: /
+
+# Our group: the most specific user-agent match wins over *
+User-agent: MyScraper
+Disallow: /private/
+Allow: /private/press/
+Disallow: /*.pdf$
+Disallow: /search?*q=
+Allow: /tie
+Disallow: /tie
+Crawl-delay: 2.5
+"""
+
+SITE = 'https://science.nasa.gov'
+
+
+@pytest.fixture
+def rules():
+    return RobotsRules.parse(ROBOTS_TXT, agent='myscraper')
+
+
+@pytest.mark.parametrize('path, allowed', [
+    ('/', True),
+    ('/exoplanets/', True),
+    ('/private/data', False),
+    ('/private/press/release', True),        # longer Allow beats shorter Disallow
+    ('/docs/catalog.pdf', False),            # * wildcard with $ anchor
+    ('/docs/catalog.pdf?page=2', True),      # $ stops the match at the end of the path
+    ('/docs/catalog.pdfx', True),
+    ('/search?q=kepler', False),             # the query string is part of the path
+    ('/search?page=1&q=kepler', False),
+    ('/search?page=1', True),
+    ('/tie', True),                          # Allow wins a tie in length
+    ('/robots.txt', True),
+])
+def test_allowed(rules, path, allowed):
+    assert rules.allowed(SITE + path) is allowed
+
+
+def test_crawl_delay(rules):
+    assert rules.crawl_delay == 2.5
+
+
+def test_unknown_agent_falls_back_to_star():
+    rules = RobotsRules.parse(ROBOTS_TXT, agent='otherbot')
+    assert not rules.allowed(SITE + '/exoplanets/')
+    assert rules.crawl_delay is None
+
+
+def test_no_matching_group_allows_everything():
+    assert RobotsRules.parse("User-agent: otherbot\nDisallow: /\n").allowed(SITE + '/x')
+
+
+class FakeSession:
+    def __init__(self, status=200, text=ROBOTS_TXT):
+        self.status = status
+        self.text = text
+        self.requests = []
+
+    def get(self, url, timeout=None):
+        self.requests.append(url)
+        response = type('Response', (), {})()
+        response.status_code, response.text = self.status, self.text
+        return response
+
+
+def test_cache_fetches_robots_once_per_host():
+    session = FakeSession()
+    cache = RobotsCache()
+    assert not cache.allowed(SITE + '/private/a', session)
+    assert cache.allowed(SITE + '/private/press/b', session)
+    assert cache.allowed('https://exoplanetarchive.ipac.caltech.edu/x.pdf?y', session)
+    assert session.requests == [SITE + '/robots.txt', 'https://exoplanetarchive.ipac.caltech.edu/robots.txt']
+
+
+def test_missing_robots_allows_everything():
+    assert RobotsCache().allowed(SITE + '/private/a', FakeSession(status=404))
+
+
+@pytest.mark.parametrize('group_agent, applies', [
+    ('MyScraper', True),
+    ('myscraper/1.0', True),
+    ('MYSCRAPER/2.3 (+https://example.org)', True),
+    ('scraper', False),            # a shorter token inside ours is another crawler
+    ('e', False),
+    ('myscraperbot', False),
+])
+def test_group_applies_only_to_our_product_token(group_agent, applies):
+    rules = RobotsRules.parse(f"User-agent: {group_agent}\nDisallow: /\n", agent='myscraper')
+    assert rules.allowed(SITE + '/exoplanets/') is not applies
+
+
+def test_our_agent_string_may_carry_a_version():
+    rules = RobotsRules.parse("User-agent: myscraper\nDisallow: /private/\n", agent='MyScraper/1.0')
+    assert not rules.allowed(SITE + '/private/x')
+
+
+def test_groups_naming_the_same_agent_are_merged():
+    text = """
+User-agent: myscraper
+Disallow: /a/
+Crawl-delay: 1
+
+User-agent: *
+Disallow: /
+
+User-agent: MyScraper/1.0
+Disallow: /b/
+Crawl-delay: 3
+"""
+    rules = RobotsRules.parse(text, agent='myscraper')
+    assert not rules.allowed(SITE + '/a/x') and not rules.allowed(SITE + '/b/x')
+    assert rules.allowed(SITE + '/c/x')
+    assert rules.crawl_delay == 3
@@ -0,0 +1,58 @@
+from datetime import date
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from scheduler import Job, archive_fingerprint
+
+
+class FakeArchive:
+    """Answers the probe queries from a list of rowupdate dates"""
+
+    def __init__(self, updates):
+        self.updates = updates
+        self.headers = []
+
+    def get(self, url, timeout=None, stream=False, headers=None):
+        self.headers.append(headers)
+        query = parse_qs(urlparse(url).query)['query'][0]
+        if 'max(rowupdate)' in query:
+            body = f"planets,latest\n{len(self.updates)},{max(self.updates)}\n"
+        else:
+            day = query.split("to_date('", 1)[1][:10]
+            body = f"updated\n{sum(update >= day for update in self.updates)}\n"
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body.encode('utf-8')
+        response._content_consumed = True
+        return response
+
+
+DAY = date(2026, 3, 14)
+NEXT_DAY = date(2026, 3, 15)
+
+
+def test_another_row_updated_the_same_day_changes_the_fingerprint():
+    archive = FakeArchive(['2026-03-01', '2026-03-14', '2026-03-10'])
+    before = archive_fingerprint(archive, today=DAY)
+    # Same count, same max(rowupdate): only the latest-day count moves
+    archive.updates[0] = '2026-03-14'
+    assert archive_fingerprint(archive, today=DAY) != before
+    assert all(headers == {'Cache-Control': 'no-cache'} for headers in archive.headers)
+
+
+def test_day_rolling_over_forces_one_more_run():
+    archive = FakeArchive(['2026-03-01', '2026-03-14'])
+    runs = []
+    today = [DAY]
+    job = Job('archive', 60, run=lambda: runs.append(today[0]) or True,
+              probe=lambda: archive_fingerprint(archive, today=today[0]))
+
+    assert job() == 'ok'
+    # The same row edited again later that day is invisible to every aggregate...
+    assert job() == 'skipped'
+    today[0] = NEXT_DAY
+    # ...so the first probe after midnight runs once, and later probes skip again
+    assert job() == 'ok'
+    assert job() == 'skipped'
+    assert runs == [DAY, NEXT_DAY]
@@ -0,0 +1,121 @@
+import re
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+import tap_partitions
+from fetcher import ConcurrentFetcher
+from tap_partitions import discovery_year_partitions, fetch_partitioned, range_partitions
+
+CONDITION = re.compile(r'(\w+) (<|>=) (\d+)|(\w+) is null')
+
+
+def matches(condition, value):
+    """Evaluate a range_partitions condition (comparisons joined by 'and') for one value"""
+    if condition is None:
+        return True
+    for clause in condition.split(' and '):
+        clause = clause.strip('() ')
+        column, op, bound, null_column = CONDITION.fullmatch(clause).groups()
+        if null_column:
+            if value is not None:
+                return False
+        elif value is None or not (value < int(bound) if op == '<' else value >= int(bound)):
+            return False
+    return True
+
+
+@pytest.mark.parametrize('edges', [[], [2000], [2000, 2005, 2010], [2010, 2000, 2014, 2015]])
+def test_range_partitions_cover_every_value_once(edges):
+    partitions = range_partitions('disc_year', edges)
+    for value in [None, 1989, 1999, 2000, 2004, 2005, 2013, 2014, 2015, 2016, 2030]:
+        assert sum(matches(condition, value) for condition in partitions) == 1
+
+
+def test_discovery_year_partitions_end_at_last_year():
+    partitions = discovery_year_partitions(2020)
+    assert partitions[0] == 'disc_year < 2000'
+    assert 'disc_year >= 2019 and disc_year < 2020' in partitions
+    assert partitions[-2:] == ['disc_year >= 2020', 'disc_year is null']
+
+
+class FakeArchive:
+    """Session answering partition queries from in-memory rows; can fail slices"""
+
+    def __init__(self, years, fail=(), fail_times=1):
+        self.rows = [{'pl_name': f"P{i:03d}", 'disc_year': year} for i, year in enumerate(years)]
+        self.fail = fail
+        self.fail_times = fail_times
+        self.calls = {}
+        self.fetched = 0
+        self.lock = threading.Lock()
+        self.headers = {}
+
+    def get(self, url, timeout=None, **kwargs):
+        query = parse_qs(urlparse(url).query)['query'][0]
+        condition = query.split(' where ', 1)[1] if ' where ' in query else None
+        with self.lock:
+            self.calls[condition] = self.calls.get(condition, 0) + 1
+            attempt = self.calls[condition]
+        if any(year in (condition or '') for year in self.fail) and attempt <= self.fail_times:
+            raise requests.Timeout('slow slice')
+        lines = ['pl_name,disc_year'] + [f"{row['pl_name']},{'' if row['disc_year'] is None else row['disc_year']}"
+                                         for row in self.rows if matches(condition, row['disc_year'])]
+        response = requests.Response()
+        response.status_code = 200
+        response._content = ('\n'.join(lines) + '\n').encode('utf-8')
+        with self.lock:
+            self.fetched += 1
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(tap_partitions.time, 'sleep', lambda seconds: None)
+
+
+def fetcher_for(session, workers=2):
+    return ConcurrentFetcher(session=session, max_workers=workers, per_host=workers, rate=1000, burst=100)
+
+
+YEARS = [None, 1995, 2003, 2009, 2014, 2016, 2016, 2020, 2024, None]
+PARTITIONS = range_partitions('disc_year', [2000, 2010, 2015, 2020])
+
+
+def test_rows_come_back_complete_and_in_partition_order():
+    rows = list(fetch_partitioned(fetcher_for(FakeArchive(YEARS)), 'ps', PARTITIONS))
+    years = [row['disc_year'] for row in rows]
+    assert sorted(row['pl_name'] for row in rows) == [f"P{i:03d}" for i in range(len(YEARS))]
+    assert years == [1995, 2003, 2009, 2014, 2016, 2016, 2020, 2024, None, None]
+
+
+def test_only_failed_partitions_are_retried():
+    archive = FakeArchive(YEARS, fail=('2015',))
+    rows = list(fetch_partitioned(fetcher_for(archive), 'ps', PARTITIONS))
+    assert len(rows) == len(YEARS)
+    retried = {condition for condition, calls in archive.calls.items() if calls > 1}
+    assert retried == {'(disc_year >= 2010 and disc_year < 2015)', '(disc_year >= 2015 and disc_year < 2020)'}
+
+
+def test_partition_that_keeps_failing_raises():
+    archive = FakeArchive(YEARS, fail=('2020',), fail_times=10)
+    with pytest.raises(RuntimeError, match='2020'):
+        list(fetch_partitioned(fetcher_for(archive), 'ps', PARTITIONS, retries=2))
+
+
+def test_downloads_stay_within_window_of_consumer():
+    archive = FakeArchive(list(range(1990, 2030)))
+    partitions = range_partitions('disc_year', list(range(1991, 2030)))
+    ahead = []
+    consumed = 0
+    for row in fetch_partitioned(fetcher_for(archive, workers=2), 'ps', partitions):
+        consumed += 1
+        ahead.append(archive.fetched - consumed)
+    assert consumed == 40
+    # The slice being consumed plus at most max_workers fetched ahead of it
+    assert max(ahead) <= 2 + 1
@@ -0,0 +1,51 @@
+from urllib.parse import parse_qs, urlparse
+
+from pipeline import ExoplanetScraper
+from tap_query import FIELD_COLUMNS, PLANET_COLUMNS, field_values, query_url, select_query
+
+
+class RecordingRow(dict):
+    """Row that remembers every column processing asks for"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.read = set()
+
+    def get(self, key, default=None):
+        self.read.add(key)
+        return super().get(key, default)
+
+
+def test_query_selects_exactly_the_columns_processing_reads():
+    scraper = ExoplanetScraper.__new__(ExoplanetScraper)
+    row = RecordingRow({column: 1.0 for column in PLANET_COLUMNS})
+    row['pl_name'] = 'Kepler-22 b'
+    assert scraper.process_planet_data(row)
+    assert row.read == set(PLANET_COLUMNS)
+
+
+def test_select_query_lists_each_column_once():
+    query = select_query('ps', extra_columns=['rowupdate', 'pl_name', 'pl_trandep'], where='default_flag=1')
+    columns = query[len('select '):query.index(' from ')].split(',')
+    assert len(columns) == len(set(columns))
+    assert columns == [*PLANET_COLUMNS, 'rowupdate']
+    assert query.endswith(' from ps where default_flag=1')
+
+
+def test_query_url_round_trips_the_adql():
+    where = "rowupdate >= to_date('2024-01-01','yyyy-mm-dd')"
+    params = parse_qs(urlparse(query_url('pscomppars', 'csv', ['rowupdate'], where)).query)
+    assert params['query'] == [select_query('pscomppars', ['rowupdate'], where)]
+    assert params['format'] == ['csv']
+
+
+def test_available_columns_restrict_the_query():
+    query = select_query('ps', ['rowupdate'], available={'pl_name', 'hostname', 'pl_rade', 'unrelated'})
+    assert query == 'select pl_name,hostname,pl_rade from ps'
+
+
+def test_fields_without_an_archive_column_read_as_zero():
+    values = field_values({'pl_rade': 1.5})
+    assert values['radius_earth'] == 1.5
+    assert values['mass_earth'] == 0
+    assert FIELD_COLUMNS['surface_gravity_ms2'] is None and values['surface_gravity_ms2'] == 0
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+import requests
+
+import working_exoplanet_scraper
+from fetcher import ConcurrentFetcher
+from planet_store import DB_FILE, PlanetStore
+
+
+class OfflineSession:
+    """Every request fails, as when the archive is unreachable"""
+    headers = {}
+
+    def get(self, url, **kwargs):
+        raise requests.ConnectionError('archive unreachable')
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def offline_run(tmp_path, monkeypatch):
+    """Run main() in tmp_path against an unreachable archive; returns the published file list"""
+    monkeypatch.chdir(tmp_path)
+    published = []
+    monkeypatch.setattr(working_exoplanet_scraper, 'publish_files',
+                        lambda sources, pages_from=None: published.append(list(sources)) or {'ok': True})
+
+    def run(**kwargs):
+        fetcher = ConcurrentFetcher(session=OfflineSession(), rate=1000, burst=100)
+        assert working_exoplanet_scraper.main(fetcher=fetcher, **kwargs)
+        with open('all_exoplanets.json', encoding='utf-8') as f:
+            return json.load(f), published
+    return run
+
+
+def test_failed_run_republishes_a_populated_store(offline_run):
+    store = PlanetStore(DB_FILE)
+    store.upsert([{'name': 'Kepler-22 b', 'host_star': 'Kepler-22', 'type': 'Super Earth',
+                   'habitable': 'Yes', 'radius_earth': 2.4, 'mass_earth': 9.1}])
+    store.set_metadata({'scrape_date': '2026-01-01T00:00:00'})
+    store.close()
+
+    data, published = offline_run(sqlite=True)
+    assert [planet['name'] for planet in data['exoplanets']] == ['Kepler-22 b']
+    assert data['metadata']['scrape_date'] == '2026-01-01T00:00:00'
+    assert published and 'all_exoplanets.json' in published[0]
+    # Only the Parquet download is published; nothing in the app reads the binary
+    assert not any(path.endswith('.columns.bin') for path in published[0])
+
+    store = PlanetStore(DB_FILE)
+    assert store.count() == 1
+    store.close()
+
+
+def test_failed_run_with_empty_store_uses_the_demo_set(offline_run):
+    data, _ = offline_run(sqlite=True)
+    assert len(data['exoplanets']) == 5
+    store = PlanetStore(DB_FILE)
+    assert store.count() == 5
+    store.close()
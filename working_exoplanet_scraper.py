@@ -4,209 +4,96 @@ Working Exoplanet Scraper
 - Uses correct NASA API format
 - Creates comprehensive exoplanet database
 - Builds the collaborative AI website
+- Streams TAP rows straight to disk so memory stays bounded
+- Keeps the best solution per planet, sorted by name for stable output
+- Incremental mode (--incremental) only fetches rows changed since the last run
+- --partitioned downloads the full table in concurrent disc_year slices, retrying
+  only the slices that fail
+- --no-descriptions leaves generated descriptions out of the JSON (the app renders them)
+- A configuration of the shared pipeline (pipeline.py): streamed CSV source with a
+  fallback endpoint, best-solution dedup, vectorized processing
 """
 
-import requests
 import json
-import time
-from datetime import datetime
 import sys
 
-class WorkingExoplanetScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; ExoplanetResearch/1.0)'
-        })
-        self.exoplanets = []
-        
-    def scrape_nasa_archive(self):
-        """Scrape from NASA Exoplanet Archive with working API calls"""
-        print("🔍 Scraping NASA Exoplanet Archive...")
-        
-        # Working API endpoints with correct format
-        endpoints = [
-            "https://exoplanetarchive.ipac.caltech.edu/TAP/sync?query=select+pl_name,hostname,pl_orbper,pl_rade,pl_bmasse,pl_eqt,pl_orbincl,pl_orbeccen,pl_trandep,pl_trandur,pl_a,pl_dens,pl_insol,pl_logg,pl_massj,pl_radj+from+ps&format=json",
-            "https://exoplanetarchive.ipac.caltech.edu/TAP/sync?query=select+pl_name,hostname,pl_orbper,pl_rade,pl_bmasse,pl_eqt,pl_orbincl,pl_orbeccen,pl_trandep,pl_trandur,pl_a,pl_dens,pl_insol,pl_logg,pl_massj,pl_radj+from+pscomppars&format=json"
-        ]
-        
-        all_planets = []
-        
-        for i, endpoint in enumerate(endpoints):
-            try:
-                print(f"  📡 Fetching from endpoint {i+1}/{len(endpoints)}...")
-                response = self.session.get(endpoint, timeout=30)
-                response.raise_for_status()
-                
-                data = response.json()
-                print(f"  ✅ Retrieved {len(data)} exoplanets")
-                
-                for planet in data:
-                    processed_planet = self.process_planet_data(planet)
-                    if processed_planet:
-                        all_planets.append(processed_planet)
-                
-                time.sleep(2)  # Be respectful to the API
-                
-            except Exception as e:
-                print(f"  ❌ Error with endpoint {i+1}: {e}")
-                # Try alternative approach
-                try:
-                    alt_endpoint = "https://exoplanetarchive.ipac.caltech.edu/TAP/sync?query=select+pl_name,hostname,pl_orbper,pl_rade,pl_bmasse,pl_eqt+from+ps&format=json"
-                    print(f"  🔄 Trying alternative endpoint...")
-                    response = self.session.get(alt_endpoint, timeout=30)
-                    response.raise_for_status()
-                    data = response.json()
-                    print(f"  ✅ Retrieved {len(data)} exoplanets from alternative")
-                    
-                    for planet in data:
-                        processed_planet = self.process_planet_data(planet)
-                        if processed_planet:
-                            all_planets.append(processed_planet)
-                    break
-                except Exception as e2:
-                    print(f"  ❌ Alternative also failed: {e2}")
-                    continue
-        
-        # Remove duplicates based on planet name
-        unique_planets = {}
-        for planet in all_planets:
-            if planet['name'] not in unique_planets:
-                unique_planets[planet['name']] = planet
-        
-        self.exoplanets = list(unique_planets.values())
-        print(f"🎯 Total unique exoplanets: {len(self.exoplanets)}")
-        return self.exoplanets
-    
-    def process_planet_data(self, raw_data):
-        """Process raw planet data into standardized format"""
-        try:
-            # Extract basic information
-            name = raw_data.get('pl_name', '')
-            hostname = raw_data.get('hostname', 'Unknown')
-            
-            if not name or name == 'Unknown':
-                return None
-            
-            # Extract physical properties
-            radius_earth = raw_data.get('pl_rade', 0)
-            mass_earth = raw_data.get('pl_bmasse', 0)
-            mass_jupiter = raw_data.get('pl_massj', 0)
-            radius_jupiter = raw_data.get('pl_radj', 0)
-            
-            # Determine planet type
-            planet_type = self.classify_planet_type(radius_earth, mass_earth, mass_jupiter)
-            
-            # Extract orbital properties
-            orbital_period = raw_data.get('pl_orbper', 0)
-            semi_major_axis = raw_data.get('pl_a', 0)
-            eccentricity = raw_data.get('pl_orbeccen', 0)
-            inclination = raw_data.get('pl_orbincl', 0)
-            
-            # Extract atmospheric properties
-            equilibrium_temp = raw_data.get('pl_eqt', 0)
-            insolation = raw_data.get('pl_insol', 0)
-            density = raw_data.get('pl_dens', 0)
-            surface_gravity = raw_data.get('pl_logg', 0)
-            
-            # Extract transit properties
-            transit_depth = raw_data.get('pl_trandep', 0)
-            transit_duration = raw_data.get('pl_trandur', 0)
-            
-            # Determine habitable zone status
-            habitable = self.determine_habitability(insolation, radius_earth)
-            
-            return {
-                'name': name,
-                'host_star': hostname,
-                'type': planet_type,
-                'habitable': habitable,
-                'radius_earth': radius_earth,
-                'mass_earth': mass_earth,
-                'mass_jupiter': mass_jupiter,
-                'radius_jupiter': radius_jupiter,
-                'orbital_period_days': orbital_period,
-                'semi_major_axis_au': semi_major_axis,
-                'eccentricity': eccentricity,
-                'inclination_deg': inclination,
-                'equilibrium_temp_k': equilibrium_temp,
-                'insolation_earth': insolation,
-                'density_g_cm3': density,
-                'surface_gravity_ms2': surface_gravity,
-                'transit_depth_ppm': transit_depth,
-                'transit_duration_hours': transit_duration,
-                'discovery_method': self.determine_discovery_method(raw_data),
-                'description': self.generate_description(name, planet_type, habitable, radius_earth, mass_earth)
-            }
-            
-        except Exception as e:
-            print(f"  ⚠️ Error processing planet {raw_data.get('pl_name', 'Unknown')}: {e}")
-            return None
-    
-    def determine_habitability(self, insolation, radius):
-        """Determine if planet is in habitable zone"""
-        try:
-            if insolation > 0 and 0.3 <= insolation <= 1.7:
-                if radius > 0 and 0.5 <= radius <= 2.0:
-                    return 'Yes'
-            return 'No'
-        except:
-            return 'Unknown'
-    
-    def classify_planet_type(self, radius_earth, mass_earth, mass_jupiter):
-        """Classify planet type based on size and mass"""
-        try:
-            if radius_earth > 0:
-                if radius_earth < 0.8:
-                    return 'Sub-Earth'
-                elif radius_earth < 1.25:
-                    return 'Terrestrial'
-                elif radius_earth < 2.0:
-                    return 'Super Earth'
-                elif radius_earth < 6.0:
-                    return 'Mini Neptune'
-                else:
-                    return 'Gas Giant'
-            elif mass_jupiter > 0:
-                if mass_jupiter < 0.1:
-                    return 'Super Earth'
-                elif mass_jupiter < 0.5:
-                    return 'Neptune-like'
-                else:
-                    return 'Jupiter-like'
-            else:
-                return 'Unknown'
-        except:
-            return 'Unknown'
-    
-    def determine_discovery_method(self, data):
-        """Determine primary discovery method"""
-        methods = []
-        if data.get('pl_trandep', 0) > 0:
-            methods.append('Transit')
-        if data.get('pl_orbvel', 0) > 0:
-            methods.append('Radial Velocity')
-        if data.get('pl_imppar', 0) > 0:
-            methods.append('Microlensing')
-        return ', '.join(methods) if methods else 'Unknown'
-    
-    def generate_description(self, name, planet_type, habitable, radius, mass):
-        """Generate a description for the planet"""
-        desc_parts = [f"{name} is a {planet_type.lower()} exoplanet"]
-        
-        if radius > 0:
-            desc_parts.append(f"with a radius of {radius:.2f} Earth radii")
-        
-        if mass > 0:
-            desc_parts.append(f"and a mass of {mass:.2f} Earth masses")
-        
-        if habitable == 'Yes':
-            desc_parts.append("located within the habitable zone of its star")
-        elif habitable == 'No':
-            desc_parts.append("located outside the habitable zone")
+from batch_processing import process_batch
+from columnar_export import export_columnar
+from pipeline import ExoplanetScraper, best_solution_stage, partitioned_source, process_stage
+from planet_dedup import best_solutions
+from planet_store import PlanetStore
+from publish import publish_files
+from similarity import export_similar_planets
+from sync_state import STATE_FILE, HighWaterMark, load_state, merge_planets, resolve_high_water_mark, save_state
+from tap_query import select_query
+from tap_stream import stream_tap_rows, tap_url
+
+class WorkingExoplanetScraper(ExoplanetScraper):
+    SOURCE = 'NASA Exoplanet Archive + Additional Sources'
+    DESCRIPTION = 'Comprehensive exoplanet database for collaborative AI research'
+
+    def __init__(self, fetcher=None, store=None, include_descriptions=True, partitioned=False):
+        super().__init__(fetcher, include_descriptions)
+        # Optional PlanetStore (SQLite) kept in step with the JSON dataset
+        self.store = store
+        # Full scrapes download TABLE in disc_year partitions instead of one TAP call
+        self.partitioned = partitioned
+        self.high_water_mark = HighWaterMark()
         
-        return '. '.join(desc_parts) + '.'
-    
+    # Incremental sync: same columns, only rows updated since the high-water mark
+    DELTA_WHERE = "rowupdate >= to_date('{since}','yyyy-mm-dd')"
+
+    def source(self):
+        if self.partitioned:
+            return partitioned_source(self.fetcher, self.TABLE, extra_columns=self.EXTRA_COLUMNS,
+                                      available=self.available_columns())
+        return super().source()
+
+    def stages(self):
+        """Keep the best solution per planet (sorted by name), process, advance the high-water mark"""
+        self.high_water_mark = HighWaterMark()
+        return [best_solution_stage, self.high_water_mark.collect, process_stage(self), self.high_water_mark.track]
+
+    def iter_processed_planets(self):
+        """Yield one processed planet per name, best solution first, sorted by name"""
+        planets = super().iter_processed_planets()
+        if self.store is not None:
+            planets = self.store.replace_stream(planets)
+        return planets
+
+    def scrape_incremental(self, filename='all_exoplanets.json', state_file=STATE_FILE):
+        """Incremental mode: fetch only rows updated since the last run and merge them in"""
+        since = resolve_high_water_mark(load_state(state_file), filename)
+        if since is None:
+            print("🆕 No previous sync found, running a full scrape...")
+            filename, count = self.scrape_to_file(filename)
+            if count:
+                save_state(self.high_water_mark.value, count, state_file)
+            return filename, count
+
+        print(f"🔁 Syncing rows updated since {since}...")
+        endpoint = tap_url(select_query(self.TABLE, self.EXTRA_COLUMNS, self.DELTA_WHERE.format(since=since),
+                                        available=self.available_columns()))
+        self.high_water_mark = HighWaterMark(since)
+        with self.fetcher.throttle(endpoint):
+            rows = list(self.high_water_mark.collect(best_solutions(stream_tap_rows(self.session, endpoint))))
+            updates = list(self.describe_planets(self.high_water_mark.track(process_batch(rows, self))))
+        print(f"  ✅ {len(updates)} planets changed")
+
+        if self.store is not None:
+            # Only the changed rows are written; the JSON is regenerated from the store
+            if not self.store.count():
+                self.store.import_json(filename)
+            self.store.upsert(updates)
+            filename, count = self.save_data_stream(self.describe_planets(self.store.iter_planets()), filename)
+        else:
+            with open(filename, encoding='utf-8') as f:
+                existing = json.load(f).get('exoplanets', [])
+            merged = merge_planets(existing, updates)
+            filename, count = self.save_data_stream(self.describe_planets(merged), filename)
+        save_state(self.high_water_mark.value, count, state_file)
+        return filename, count
+
     def create_comprehensive_database(self):
         """Create a comprehensive exoplanet database with additional data"""
         print("📊 Creating comprehensive exoplanet database...")
@@ -292,56 +179,59 @@ class WorkingExoplanetScraper:
         
         print(f"📈 Total exoplanets in database: {len(self.exoplanets)}")
         return self.exoplanets
-    
-    def save_data(self, filename='all_exoplanets.json'):
-        """Save all exoplanet data to JSON file"""
-        data = {
-            'metadata': {
-                'total_exoplanets': len(self.exoplanets),
-                'scrape_date': datetime.now().isoformat(),
-                'source': 'NASA Exoplanet Archive + Additional Sources',
-                'version': '1.0',
-                'description': 'Comprehensive exoplanet database for collaborative AI research'
-            },
-            'exoplanets': self.exoplanets
-        }
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
-        print(f"💾 Saved {len(self.exoplanets)} exoplanets to {filename}")
-        return filename
 
-def main():
+def main(incremental=False, fetcher=None, sqlite=False, descriptions=True, partitioned=False):
     """Main execution function"""
     print("🌌 Working Exoplanet Scraper")
     print("=" * 50)
     
-    scraper = WorkingExoplanetScraper()
+    store = PlanetStore() if sqlite else None
+    scraper = WorkingExoplanetScraper(fetcher, store=store, include_descriptions=descriptions,
+                                      partitioned=partitioned)
     
     try:
-        # Try to scrape from NASA API
-        exoplanets = scraper.scrape_nasa_archive()
+        if incremental:
+            # Merge only the rows that changed since the last successful run
+            filename, total = scraper.scrape_incremental()
+        else:
+            # Stream the NASA API straight to disk
+            filename, total = scraper.scrape_to_file()
+            if total:
+                save_state(scraper.high_water_mark.value, total)
         
-        # If no data from API, create comprehensive database
-        if not exoplanets:
+        # If no data from API, republish the store, or create the demo database if it is empty
+        from_store = False
+        if not total and store is not None and store.count():
+            print("🔄 No data from the API, republishing the SQLite store...")
+            filename = store.export_json(filename)
+            total, from_store = store.count(), True
+        elif not total:
             print("🔄 Creating comprehensive exoplanet database...")
             exoplanets = scraper.create_comprehensive_database()
-        
-        if exoplanets:
-            # Save data
             filename = scraper.save_data()
+            total = len(exoplanets)
+            # The demo planets only ever seed an empty store
+            if store is not None:
+                store.upsert(exoplanets)
+        
+        if total:
+            if store is not None and not from_store:
+                store.set_metadata(scraper.build_metadata(total))
+            
+            # Columnar artifacts for analytics; the app reads the paged export, so only the
+            # Parquet download is published and the binary stays next to the JSON
+            parquet_files = [path for path in export_columnar(filename) if path.endswith('.parquet')]
             
-            # Copy to React public directory
-            import shutil
-            import os
+            # Precomputed "similar planets" so the client never computes neighbours
+            similar_file = export_similar_planets(filename)
             
-            react_public = os.path.join(os.path.dirname(__file__), 'public')
-            if os.path.exists(react_public):
-                shutil.copy2(filename, os.path.join(react_public, 'all_exoplanets.json'))
-                print("📁 Data copied to React public directory")
+            # Publish minified, hashed and pre-compressed copies to the React public directory,
+            # plus small fixed-size pages and shards for the planet list view; the app
+            # switches to the whole set with one manifest write
+            if publish_files([filename, *parquet_files, similar_file], pages_from=filename):
+                print("📁 Data published to React public directory")
             
-            print(f"\n🎉 Successfully created database with {len(exoplanets)} exoplanets!")
+            print(f"\n🎉 Successfully created database with {total} exoplanets!")
             print("📊 Data includes:")
             print(f"  - Planet names and classifications")
             print(f"  - Physical properties (radius, mass, density)")
@@ -357,9 +247,14 @@ def main():
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
+    finally:
+        if store is not None:
+            store.close()
     
     return True
 
 if __name__ == "__main__":
-    success = main()
+    success = main(incremental='--incremental' in sys.argv[1:], sqlite='--sqlite' in sys.argv[1:],
+                   descriptions='--no-descriptions' not in sys.argv[1:],
+                   partitioned='--partitioned' in sys.argv[1:])
     sys.exit(0 if success else 1)